@@ -40,7 +40,7 @@ def main():
 
     try:
         sg_instance.connect()
-        logger.info(f"✓ Connected: {sg_instance.is_connected()}")
+        logger.info(f"✓ Connected: {sg_instance.is_connected}")
     except (ValueError, ConnectionError) as e:
         logger.error(f"✗ Connection failed: {e}")
         logger.error("Please check your environment variables: SG_URL, SG_SCRIPT_NAME, SG_SCRIPT_KEY")
@@ -132,7 +132,7 @@ def main():
     # ========================================================================
     logger.info("\n[STEP 4] Disconnecting from Shotgun...")
     sg_instance.disconnect()
-    logger.info(f"✓ Disconnected: {not sg_instance.is_connected()}")
+    logger.info(f"✓ Disconnected: {not sg_instance.is_connected}")
 
     logger.info("\n" + "=" * 60)
     logger.info("Example completed successfully!")
@@ -0,0 +1,119 @@
+"""
+Smoke test for the Shotgun connection.
+
+Opens a real connection with the SG_URL / SG_SCRIPT_NAME / SG_SCRIPT_KEY credentials,
+runs a Step query and disconnects. Kept out of core.shotgrid_instance so importing
+the module never touches the network.
+"""
+
+import logging
+
+from core.shotgrid_instance import ShotgridInstance, DEFAULT_STEP_FIELDS
+from utils.logger import setup_logging
+
+
+def main():
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    # Test persistent connection pattern, the connection is released even if a query raises
+    with ShotgridInstance() as sg_instance:
+        # Verify connection
+        print(f"Connected: {sg_instance.is_connected}")
+
+        # steps are cached for 10 minutes after the first call
+        # steps = sg_instance.get_steps()
+
+        # getting schemas
+        # schemas = sg_instance.schema_field_read_cached("Step")
+        # print(schemas)
+
+        # getting entities - Steps, Shots and Tasks read in one concurrent round
+        sandbox = ShotgridInstance.ref("Project", 124)
+        entities, shots, tasks = sg_instance.batched_find([
+            {"entity_type": "Step", "filters": [], "fields": DEFAULT_STEP_FIELDS},
+            {"entity_type": "Shot", "filters": [["project", "is", sandbox]], "fields": ["id", "code", "tasks"]},
+            {"entity_type": "Task", "filters": [["project", "is", sandbox]], "fields": ["id", "content", "entity"]},
+        ])
+        print(f"Found {len(entities)} steps, {len(shots)} shots, {len(tasks)} tasks")
+        print(entities)
+
+        # reading several entities by id - one find with an "in" filter instead of one call per id
+        # assets = sg_instance.instance.find(
+        #     entity_type="Asset",
+        #     filters=[
+        #         ["project", "is", ShotgridInstance.ref("Project", 124)],
+        #         ["id", "in", [1445, 1446, 1447]]
+        #     ],
+        #     fields=['code', 'sg_asset_type']
+        # )
+
+        # update entities - several updates in one request
+        # data = {'sg_asset_type': 'Character'}
+        # updated_entities = sg_instance.batch([
+        #     {"request_type": "update", "entity_type": "Asset", "entity_id": 1445, "data": data},
+        #     {"request_type": "update", "entity_type": "Asset", "entity_id": 1446, "data": data},
+        # ])
+        # print(updated_entities)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# data = [
+#     {'type': 'Step', 'id': 2, 'code': 'Online', 'description': None, 'color': '213,213,213', 'short_name': 'ONL', 'department': None, 'list_order': 5, 'entity_type': 'Shot', 'cached_display_name': 'Online', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 54, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 6, 'code': 'FX', 'description': None, 'color': '253,188,0', 'short_name': 'FX', 'department': None, 'list_order': 11, 'entity_type': 'Shot', 'cached_display_name': 'FX', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 7, 'code': 'Light', 'description': None, 'color': '25,118,27', 'short_name': 'LGT', 'department': None, 'list_order': 12, 'entity_type': 'Shot', 'cached_display_name': 'Light', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 8, 'code': 'Comp', 'description': None, 'color': '0,126,174', 'short_name': 'CMP', 'department': None, 'list_order': 13, 'entity_type': 'Shot', 'cached_display_name': 'Comp', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 13, 'code': 'Art', 'description': None, 'color': '253,94,99', 'short_name': 'ART', 'department': None, 'list_order': 7, 'entity_type': 'Asset', 'cached_display_name': 'Art', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 14, 'code': 'Model', 'description': None, 'color': '254,173,146', 'short_name': 'MDL', 'department': None, 'list_order': 8, 'entity_type': 'Asset', 'cached_display_name': 'Model', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 15, 'code': 'Rig', 'description': None, 'color': '161,236,154', 'short_name': 'RIG', 'department': None, 'list_order': 9, 'entity_type': 'Asset', 'cached_display_name': 'Rig', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 16, 'code': 'Texture', 'description': None, 'color': '253,254,152', 'short_name': 'TXT', 'department': None, 'list_order': 10, 'entity_type': 'Asset', 'cached_display_name': 'Texture', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 56, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 32, 'code': 'Animation', 'description': None, 'color': '192,97,253', 'short_name': 'ANM', 'department': None, 'list_order': 12, 'entity_type': 'Asset', 'cached_display_name': 'Animation', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2012, 11, 26, 16, 22, 44, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 35, 'code': 'Layout', 'description': None, 'color': '183,0,188', 'short_name': 'LAY', 'department': None, 'list_order': 8, 'entity_type': 'Shot', 'cached_display_name': 'Layout', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2015, 11, 2, 14, 55, 45, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 106, 'code': 'Animation', 'description': None, 'color': '252,47,140', 'short_name': 'ANM', 'department': None, 'list_order': 9, 'entity_type': 'Shot', 'cached_display_name': 'Animation', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2015, 12, 17, 10, 28, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 119, 'code': 'Concept', 'description': None, 'color': '252,47,140', 'short_name': 'CPT', 'department': None, 'list_order': 1, 'entity_type': 'Level', 'cached_display_name': 'Concept', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 57, 59, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 28, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 120, 'code': 'Level Design', 'description': None, 'color': '254,125,179', 'short_name': 'LD', 'department': None, 'list_order': 2, 'entity_type': 'Level', 'cached_display_name': 'Level Design', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 18, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 30, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 121, 'code': 'Modeling', 'description': None, 'color': '255,181,76', 'short_name': 'MDL', 'department': None, 'list_order': 3, 'entity_type': 'Level', 'cached_display_name': 'Modeling', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 25, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 32, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 122, 'code': 'Level Art', 'description': None, 'color': '254,205,138', 'short_name': 'LA', 'department': None, 'list_order': 4, 'entity_type': 'Level', 'cached_display_name': 'Level Art', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 34, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 34, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 123, 'code': 'Lighting', 'description': None, 'color': '253,252,100', 'short_name': 'LTG', 'department': None, 'list_order': 5, 'entity_type': 'Level', 'cached_display_name': 'Lighting', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 41, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 36, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 124, 'code': 'Animation', 'description': None, 'color': '253,254,152', 'short_name': 'ANM', 'department': None, 'list_order': 6, 'entity_type': 'Level', 'cached_display_name': 'Animation', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 49, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 41, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 125, 'code': 'FX', 'description': None, 'color': '103,226,102', 'short_name': 'FX', 'department': None, 'list_order': 7, 'entity_type': 'Level', 'cached_display_name': 'FX', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 43, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 126, 'code': 'Gameplay', 'description': None, 'color': '161,236,154', 'short_name': 'GPL', 'department': None, 'list_order': 8, 'entity_type': 'Level', 'cached_display_name': 'Gameplay', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 59, 1, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 46, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 127, 'code': 'QA', 'description': None, 'color': '50,149,253', 'short_name': 'QA', 'department': None, 'list_order': 9, 'entity_type': 'Level', 'cached_display_name': 'QA', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 59, 7, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 47, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 128, 'code': 'Integration', 'description': None, 'color': '129,183,255', 'short_name': 'INT', 'department': None, 'list_order': 10, 'entity_type': 'Level', 'cached_display_name': 'Integration', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 59, 17, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 50, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 129, 'code': 'Design', 'description': None, 'color': '254,125,179', 'short_name': 'DSN', 'department': None, 'list_order': 6, 'entity_type': 'Asset', 'cached_display_name': 'Design', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 3, 21, 11, 19, 48, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 131, 'code': 'Visualization', 'description': None, 'color': '2,149,216', 'short_name': 'VIZ', 'department': None, 'list_order': 14, 'entity_type': 'Asset', 'cached_display_name': 'Visualization', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 3, 21, 11, 20, 50, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 132, 'code': 'Class-A', 'description': None, 'color': '222,182,255', 'short_name': 'CSA', 'department': None, 'list_order': 15, 'entity_type': 'Asset', 'cached_display_name': 'Class-A', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 3, 21, 11, 21, 26, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 133, 'code': 'Tracking', 'description': None, 'color': '50,149,253', 'short_name': 'TRK', 'department': None, 'list_order': 6, 'entity_type': 'Shot', 'cached_display_name': 'Tracking', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 4, 26, 12, 33, 29, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 134, 'code': 'Roto', 'description': None, 'color': '156,1,255', 'short_name': 'RTO', 'department': None, 'list_order': 7, 'entity_type': 'Shot', 'cached_display_name': 'Roto', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 4, 26, 12, 41, 4, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 136, 'code': 'Character FX', 'description': None, 'color': '253,94,99', 'short_name': 'CFX', 'department': None, 'list_order': 10, 'entity_type': 'Shot', 'cached_display_name': 'Character FX', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 4, 26, 18, 20, 11, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 137, 'code': 'Character FX', 'description': None, 'color': '129,183,255', 'short_name': 'CFX', 'department': None, 'list_order': 11, 'entity_type': 'Asset', 'cached_display_name': 'Character FX', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 10, 11, 14, 0, 51, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 142, 'code': 'Surfacing', 'description': None, 'color': None, 'short_name': 'SF', 'department': None, 'list_order': 5, 'entity_type': 'Asset', 'cached_display_name': 'Surfacing', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 3, 21, 2, 1, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 175, 'code': 'Previs', 'description': None, 'color': '94,0,0', 'short_name': 'PRE', 'department': None, 'list_order': 4, 'entity_type': 'Shot', 'cached_display_name': 'Previs', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 0, 12, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 176, 'code': 'LightRig', 'description': None, 'color': '184,178,4', 'short_name': 'LGR', 'department': None, 'list_order': 4, 'entity_type': 'Asset', 'cached_display_name': 'LightRig', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 1, 56, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 177, 'code': 'Delivery', 'description': None, 'color': '161,236,154', 'short_name': 'DEL', 'department': None, 'list_order': 3, 'entity_type': 'Shot', 'cached_display_name': 'Delivery', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 3, 16, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 178, 'code': 'Assembly', 'description': None, 'color': '253,252,100', 'short_name': 'ASB', 'department': None, 'list_order': 2, 'entity_type': 'Shot', 'cached_display_name': 'Assembly', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 4, 31, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 179, 'code': 'Render', 'description': None, 'color': '0,230,254', 'short_name': 'RDR', 'department': None, 'list_order': 1, 'entity_type': 'Shot', 'cached_display_name': 'Render', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 180, 'code': 'Render', 'description': None, 'color': '0,230,254', 'short_name': 'RDR', 'department': None, 'list_order': 3, 'entity_type': 'Asset', 'cached_display_name': 'Render', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 7, 9, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
+#     {'type': 'Step', 'id': 181, 'code': 'Comp', 'description': None, 'color': '255,218,137', 'short_name': 'COMP', 'department': None, 'list_order': 2, 'entity_type': 'Asset', 'cached_display_name': 'Comp', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 7, 35, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)},
+#     {'type': 'Step', 'id': 182, 'code': 'Delivery', 'description': None, 'color': '161,236,154', 'short_name': 'DEL', 'department': None, 'list_order': 1, 'entity_type': 'Asset', 'cached_display_name': 'Delivery', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}
+# ]
+
+# shots = [
+#     {'type': 'Shot', 'id': 1207, 'code': 'sq010_010', 
+#      'tasks': [
+#          {'id': 6059, 'name': '00_Animatic', 'type': 'Task'}, 
+#          {'id': 6058, 'name': '01_Layout', 'type': 'Task'}, 
+#          {'id': 6060, 'name': '02_Animacion', 'type': 'Task'}, 
+#          {'id': 6062, 'name': '03_Assembly', 'type': 'Task'}, 
+#          {'id': 6063, 'name': '04_Lighting', 'type': 'Task'}, 
+#          {'id': 6065, 'name': '05_Render', 'type': 'Task'}, 
+#          {'id': 6061, 'name': '06_Comp', 'type': 'Task'}, 
+#          {'id': 6066, 'name': '07_Fx', 'type': 'Task'}, 
+#          {'id': 6064, 'name': '08_Output', 'type': 'Task'}
+#     ], 'assets': [], 'sg_versions': [], 'sg_published_files': []}]
+
+
+
@@ -0,0 +1,136 @@
+"""
+Async Path Builder for Shotgrid Manager
+
+asyncio front-end for PathBuilder, used when resolving paths for many tasks or
+assets at once (e.g. project-level directory scaffolding).
+
+The blocking shotgun_api3 calls run in the loop's default executor; every worker
+thread gets its own Shotgun client from ShotgridInstance, so N lookups cost about
+one round-trip of wall time instead of N.
+"""
+
+import asyncio
+import logging
+import weakref
+from pathlib import PurePosixPath
+from typing import List, Optional
+
+from core.shotgrid_instance import ShotgridInstance
+from core.path_builder import PathBuilder
+from utils.logger import setup_logging
+
+# Max in-flight ShotGrid requests per AsyncPathBuilder
+MAX_CONCURRENT_REQUESTS = 16
+
+
+class AsyncPathBuilder():
+    """
+    Concurrent path resolution on top of PathBuilder.
+
+    Usage:
+        builder = AsyncPathBuilder(sg_instance)
+        paths = asyncio.run(builder.get_paths_from_tasks([6799, 6800]))
+    """
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, shotgun_instance: ShotgridInstance, max_concurrency: int = MAX_CONCURRENT_REQUESTS):
+        """
+        Initialize AsyncPathBuilder with shared Shotgun instance.
+
+        Args:
+            shotgun_instance: ShotgridInstance with active connection
+            max_concurrency: Max number of ShotGrid requests in flight
+        """
+        self.path_builder = PathBuilder(shotgun_instance)
+        self.max_concurrency = max_concurrency
+
+        # One semaphore per event loop, an asyncio primitive binds to the first loop that
+        # waits on it, so a builder reused across asyncio.run calls needs a fresh one
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def _run(self, func, *args):
+        """Run a blocking PathBuilder call in the executor, capped by the running loop's semaphore."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+
+        async with semaphore:
+            return await loop.run_in_executor(None, func, *args)
+
+    async def get_path_from_task(self, task_id: int) -> Optional[PurePosixPath]:
+        """
+        Build file system path from task ID without blocking the event loop.
+
+        Args:
+            task_id: Shotgun task ID
+
+        Returns:
+            Full path, or None if unable to build path
+        """
+        return await self._run(self.path_builder.get_path_from_task, task_id)
+
+    async def get_paths_from_tasks(self, task_ids: List[int]) -> List[Optional[PurePosixPath]]:
+        """
+        Build paths for many tasks concurrently.
+
+        Args:
+            task_ids: Shotgun task IDs
+
+        Returns:
+            List of paths in the same order as task_ids,
+            None for tasks that failed or could not be resolved
+        """
+        results = await asyncio.gather(
+            *[self.get_path_from_task(task_id) for task_id in task_ids],
+            return_exceptions=True
+        )
+
+        paths = []
+        for task_id, result in zip(task_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to build path for task {task_id}: {result}")
+                paths.append(None)
+            else:
+                paths.append(result)
+
+        return paths
+
+    async def get_task_paths_from_assets(self, asset_ids: List[int]) -> List[PurePosixPath]:
+        """
+        Get all task paths for many assets concurrently.
+
+        Args:
+            asset_ids: Shotgun asset IDs
+
+        Returns:
+            Flat list of paths for all tasks on the assets
+        """
+        results = await asyncio.gather(
+            *[self._run(self.path_builder.get_task_paths_from_asset, asset_id) for asset_id in asset_ids],
+            return_exceptions=True
+        )
+
+        paths = []
+        for asset_id, result in zip(asset_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to build paths for asset {asset_id}: {result}")
+                continue
+            paths.extend(result)
+
+        self.logger.info(f"Built {len(paths)} paths for {len(asset_ids)} assets")
+        return paths
+
+
+if __name__ == "__main__":
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    sg_instance = ShotgridInstance()
+    sg_instance.connect()
+
+    async_builder = AsyncPathBuilder(sg_instance)
+    task_paths = asyncio.run(async_builder.get_paths_from_tasks([5947, 6078, 6799]))
+    logger.info(f"task paths = {task_paths}")
+
+    sg_instance.disconnect()
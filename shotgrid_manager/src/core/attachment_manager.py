@@ -3,6 +3,7 @@ from core.path_builder import PathBuilder
 from utils.logger import setup_logging
 from typing import List, Tuple
 import logging
+import os
 
 
 class AttachmentManager(BaseManager):
@@ -57,6 +58,74 @@ class AttachmentManager(BaseManager):
         )
         return uploaded_file
     
+    def upload_attachment_to_project_stream(self, project_id:int, file_path:str)-> int:
+        """
+        Upload a file to the project as a streamed multipart POST.
+
+        shotgun's upload() builds the whole request body in memory, this reads the
+        file in small chunks instead so large publishes keep memory flat.
+        Uses requests-toolbelt (listed in requirements/base.txt); when it isn't
+        installed the file goes through upload_attachment_to_project instead.
+
+        Sites with S3 direct uploads, and clients with a proxy, custom CA certs or
+        SSL validation off, go through upload_attachment_to_project instead: the
+        streamed POST only implements the legacy /upload/upload_file route on the
+        shared session.
+
+        Args:
+            project_id: Project to attach the file to
+            file_path: File to upload
+
+        Returns:
+            Created attachment id
+        """
+        self._ensure_connected()
+        sg_client = self.manager.instance
+
+        if not self._can_stream_upload(sg_client):
+            return self.upload_attachment_to_project(project_id=project_id, file_path=file_path)
+
+        try:
+            from requests_toolbelt import MultipartEncoder
+        except ImportError:
+            self.logger.warning("requests-toolbelt is not installed, uploading %s without streaming", file_path)
+            return self.upload_attachment_to_project(project_id=project_id, file_path=file_path)
+
+        url = f"{sg_client.config.scheme}://{sg_client.config.server}/upload/upload_file"
+        auth_params = {key: str(value) for key, value in sg_client._auth_params().items() if value is not None}
+
+        with open(file_path, "rb") as file_handle:
+            encoder = MultipartEncoder(fields={
+                "entity_type": "Project",
+                "entity_id": str(project_id),
+                **auth_params,
+                "file": (os.path.basename(file_path), file_handle, "application/octet-stream"),
+            })
+            response = self.manager.session.post(url, data=encoder, headers={"Content-Type": encoder.content_type})
+
+        response.raise_for_status()
+
+        # Same response format shotgun's upload() parses: "1\n:<attachment_id>\n..."
+        result = response.text
+        if not result.startswith("1"):
+            import shotgun_api3 as sg
+            raise sg.ShotgunError(f"Could not upload file successfully: {file_path}\n{result}")
+
+        attachment_id = int(result.split(":", 2)[1].split("\n", 1)[0])
+        self.logger.info(f"Streamed upload of {file_path} as attachment {attachment_id}")
+        return attachment_id
+
+    def _can_stream_upload(self, sg_client)-> bool:
+        """
+        Whether the legacy /upload/upload_file route is the one shotgun's upload() would use.
+
+        Returns:
+            False for S3 direct upload sites and for clients that keep the stock transport
+        """
+        if self.manager.uses_stock_transport(sg_client):
+            return False
+        return not sg_client.server_info.get("s3_direct_uploads_enabled", False)
+
     def download_attachment(self, attachment_id:int, target_path):
         self._ensure_connected()
         self.manager.instance.download_attachment(
@@ -78,6 +147,10 @@ class AttachmentManager(BaseManager):
         }
         return self.update_entity(entity_id=attachment_id, data=data)
 
+    def update_attachments(self, updates:List[Tuple[int, dict]])-> List[dict]:
+        """Update several attachments with one batch() call, updates are (attachment_id, data) pairs."""
+        return self.batch_update(updates)
+
 
 if __name__ == "__main__":
     from core.shotgrid_instance import ShotgridInstance
@@ -1,9 +1,50 @@
+import asyncio
+import functools
+import json
 import logging
-from typing import List, Optional
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
 
-import shotgun_api3 as sg
 from core.shotgrid_instance import ShotgridInstance
 from utils.logger import setup_logging
+from utils import sg_cache
+
+# Max requests per Shotgun batch() call, larger lists are sent in chunks
+BATCH_CHUNK_SIZE = 50
+
+# Rows per find() page when streaming results with iter_entities
+ENTITY_PAGE_SIZE = 500
+
+
+def _dedupe_filters(filters: list) -> list:
+    """
+    Drop repeated filters (e.g. from composed UI filters), keeping first-occurrence order.
+
+    Returns:
+        Deduplicated filter list, or the original list if a filter can't be serialized
+    """
+    try:
+        seen = set()
+        unique = []
+        for query_filter in filters:
+            key = json.dumps(query_filter, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                unique.append(query_filter)
+        return unique
+    except (TypeError, ValueError):
+        return filters
+
+
+async def gather_shotgrid(*coros) -> list:
+    """
+    Await several independent manager reads at once (e.g. aget_version + aget_all_users).
+
+    Returns:
+        Results in the same order as coros
+    """
+    return await asyncio.gather(*coros)
+
 
 class BaseManager():
     """
@@ -29,6 +70,29 @@ class BaseManager():
         self.manager = shotgun_instance
         setup_logging()
 
+    def __enter__(self):
+        """
+        Hold the shared connection open for a block of manager calls.
+
+        Usage:
+            with TaskManager(ShotgridInstance()) as task_manager:
+                ...
+        """
+        self.manager.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Disconnects only when the outermost with-block exits and it opened the connection
+        return self.manager.__exit__(exc_type, exc_value, traceback)
+
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Run a blocking manager call in the loop's default executor.
+        Each worker thread gets its own Shotgun client from ShotgridInstance.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
     def _ensure_connected(self):
         """
         Verify connection is active before operations.
@@ -59,16 +123,22 @@ class BaseManager():
             data=data
         )
 
+        # A new task changes cached task lists
+        if self.entity == "Task":
+            sg_cache.evict_task()
+
         self.logger.info(f"Created {self.entity} with id {new_entity.get('id')}")
         return new_entity
 
-    def update_entity(self, entity_id: int, data: dict) -> dict:
+    def update_entity(self, entity_id: int, data: dict, multi_entity_update_modes: Optional[dict] = None) -> dict:
         """
         Update an existing entity in Shotgun.
 
         Args:
             entity_id: Entity ID to update
             data: Fields to update
+            multi_entity_update_modes: Optional {field: 'set' | 'add' | 'remove'} for
+                                       multi-entity fields, the default replaces the whole list
 
         Returns:
             Updated entity dictionary
@@ -82,13 +152,80 @@ class BaseManager():
         updated_entity = self.manager.instance.update(
             entity_type=self.entity,
             entity_id=entity_id,
-            data=data
+            data=data,
+            multi_entity_update_modes=multi_entity_update_modes
         )
 
+        # Drop the shared cached row and task lists so other components don't read stale task data
+        if self.entity == "Task":
+            sg_cache.evict_task(entity_id)
+
         self.logger.info(f"Updated {self.entity} id {entity_id}")
         return updated_entity
 
-    def get_entities(self, filters: list, fields: List[str], order: List[dict] = None) -> List[dict]:
+    def batch(self, requests: List[dict]) -> List:
+        """
+        Run create/update/delete requests with Shotgun batch().
+
+        Each chunk of BATCH_CHUNK_SIZE requests is a single HTTP call and a single
+        server-side transaction.
+
+        Args:
+            requests: Shotgun batch request dicts
+                      ({'request_type': 'create', 'entity_type': ..., 'data': {...}}, ...)
+
+        Returns:
+            Results in the same order as requests
+        """
+        if not requests:
+            return []
+
+        self._ensure_connected()
+
+        results = []
+        for start in range(0, len(requests), BATCH_CHUNK_SIZE):
+            results.extend(self.manager.batch(requests[start:start + BATCH_CHUNK_SIZE]))
+
+        # Drop shared cached rows and task lists for any written tasks
+        for request in requests:
+            if request.get("entity_type") == "Task":
+                sg_cache.evict_task(request.get("entity_id"))
+
+        self.logger.info(f"Ran batch of {len(requests)} requests")
+        return results
+
+    def batch_create(self, data_list: List[dict]) -> List[dict]:
+        """
+        Create several entities of this manager's type in one batch() call.
+
+        Args:
+            data_list: Entity data dictionaries
+
+        Returns:
+            Created entity dictionaries, in the same order as data_list
+        """
+        return self.batch([
+            {"request_type": "create", "entity_type": self.entity, "data": data}
+            for data in data_list
+        ])
+
+    def batch_update(self, updates: List[Tuple[int, dict]]) -> List[dict]:
+        """
+        Update several entities of this manager's type in one batch() call.
+
+        Args:
+            updates: (entity_id, data) pairs
+
+        Returns:
+            Updated entity dictionaries, in the same order as updates
+        """
+        return self.batch([
+            {"request_type": "update", "entity_type": self.entity, "entity_id": entity_id, "data": data}
+            for entity_id, data in updates
+        ])
+
+    def get_entities(self, filters: list, fields: List[str], order: List[dict] = None,
+                     limit: Optional[int] = None, page: int = 1) -> List[dict]:
         """
         Query multiple entities from Shotgun.
 
@@ -96,6 +233,8 @@ class BaseManager():
             filters: Shotgun filter list
             fields: Fields to retrieve
             order: Optional sort order
+            limit: Optional page size, filtering and paging both happen server side
+            page: 1-based page number, only used with limit
 
         Returns:
             List of entity dictionaries
@@ -108,14 +247,100 @@ class BaseManager():
 
         entity_list = self.manager.instance.find(
             entity_type=self.entity,
-            filters=filters,
+            filters=_dedupe_filters(filters),
             fields=fields,
-            order=order
+            order=order,
+            limit=limit or 0,
+            # shotgun_api3 returns a single page for any page != 0, keep 0 (all rows) without a limit
+            page=page if limit else 0
         )
 
         self.logger.debug(f"Found {len(entity_list)} {self.entity} entities")
         return entity_list
 
+    def summarize(self, filters: list, summary_fields: List[dict], grouping: Optional[List[dict]] = None) -> dict:
+        """
+        Aggregate entities server side (count, sum, ...) instead of downloading the rows.
+
+        Args:
+            filters: Shotgun filter list
+            summary_fields: e.g. [{'field': 'id', 'type': 'count'}]
+            grouping: Optional Shotgun grouping list
+
+        Returns:
+            Summary dictionary ({'summaries': {...}, 'groups': [...]}), or {} if entity type not set
+        """
+        if not self.entity:
+            self.logger.warning("Entity type not set, cannot summarize entities")
+            return {}
+
+        self._ensure_connected()
+
+        return self.manager.instance.summarize(
+            entity_type=self.entity,
+            filters=_dedupe_filters(filters),
+            summary_fields=summary_fields,
+            grouping=grouping
+        )
+
+    def iter_entities(self, filters: list, fields: List[str], order: List[dict] = None,
+                      page_size: int = ENTITY_PAGE_SIZE) -> Iterator[dict]:
+        """
+        Stream entities one find() page at a time instead of building the whole list.
+
+        Args:
+            filters: Shotgun filter list
+            fields: Fields to retrieve
+            order: Optional sort order, defaults to id so pages don't overlap
+            page_size: Rows per request
+
+        Yields:
+            Entity dictionaries
+        """
+        order = order or [{'field_name': 'id', 'direction': 'asc'}]
+        page = 1
+        while True:
+            rows = self.get_entities(filters=filters, fields=fields, order=order, limit=page_size, page=page)
+            yield from rows
+            # A short page is the last one, saves the request for an empty page
+            if len(rows) < page_size:
+                return
+            page += 1
+
+    def get_entities_columnar(self, filters: list, fields: List[str], order: List[dict] = None) -> Dict[str, list]:
+        """
+        Query entities into parallel columns instead of a list of dicts.
+
+        Rows are streamed with iter_entities and never kept as dicts. Linked entity
+        fields keep only the linked id (None when empty); multi-entity fields keep a tuple of ids.
+
+        Args:
+            filters: Shotgun filter list
+            fields: Fields to retrieve
+            order: Optional sort order
+
+        Returns:
+            {'id': array('q'), field: list, ...}, every column has one value per row
+        """
+        columns = {"id": array("q")}
+        for field in fields:
+            if field != "id":
+                columns[field] = []
+
+        for row in self.iter_entities(filters=filters, fields=fields, order=order):
+            columns["id"].append(row["id"])
+            for field, column in columns.items():
+                if field == "id":
+                    continue
+                value = row.get(field)
+                if isinstance(value, dict):
+                    value = value.get("id")
+                elif isinstance(value, list):
+                    value = tuple(link.get("id") for link in value if isinstance(link, dict))
+                column.append(value)
+
+        return columns
+
     def get_entity(self, filters: list, fields: List[str]) -> Optional[dict]:
         """
         Query single entity from Shotgun.
@@ -135,7 +360,7 @@ class BaseManager():
 
         entity = self.manager.instance.find_one(
             entity_type=self.entity,
-            filters=filters,
+            filters=_dedupe_filters(filters),
             fields=fields
         )
 
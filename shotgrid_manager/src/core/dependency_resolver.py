@@ -214,7 +214,7 @@ class DependencyResolver:
     def _get_version_manager(self):
         """Lazy-load VersionManager."""
         if not self._version_manager:
-            from core.version_manger import VersionManager
+            from core.version_manager import VersionManager
             self._version_manager = VersionManager(self.shotgrid_instance)
             self.logger.debug("Initialized VersionManager")
         return self._version_manager
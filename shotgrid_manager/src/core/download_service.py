@@ -12,6 +12,7 @@ Path structure: /WORK_AREA/Project/ASSETS|SHOTS/Entity/Task/
 
 import logging
 import os
+import threading
 from typing import List, Dict, Optional, Callable
 from pathlib import Path
 
@@ -57,7 +58,8 @@ class DownloadService:
         self,
         version: Dict,
         task_data: Dict,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> List[str]:
         """
         Download all files from a version.
@@ -66,6 +68,8 @@ class DownloadService:
             version: Version dictionary with id, code, published_files
             task_data: Task dictionary with id, content, entity, project
             progress_callback: Optional callback(current, total, filename)
+            cancel_event: Optional event, once set no further files are downloaded
+                          and the files downloaded so far are returned
 
         Returns:
             List of downloaded file paths
@@ -99,6 +103,10 @@ class DownloadService:
         current_file = 0
 
         for pub_file in published_files:
+            if cancel_event is not None and cancel_event.is_set():
+                self.logger.info(f"Download of version {version_id} canceled")
+                break
+
             try:
                 paths = self._download_published_file(
                     pub_file,
@@ -106,7 +114,8 @@ class DownloadService:
                     task_data,
                     progress_callback,
                     current_file,
-                    total_files
+                    total_files,
+                    cancel_event
                 )
                 downloaded_paths.extend(paths)
                 current_file += len(paths)
@@ -162,7 +171,8 @@ class DownloadService:
         task_data: Dict,
         progress_callback: Optional[Callable[[int, int, str], None]],
         current_offset: int,
-        total_files: int
+        total_files: int,
+        cancel_event: Optional[threading.Event] = None
     ) -> List[str]:
         """
         Download all attachments from a published file.
@@ -174,6 +184,7 @@ class DownloadService:
             progress_callback: Progress callback
             current_offset: Current file index offset
             total_files: Total number of files
+            cancel_event: Optional event, stops before the next attachment once set
 
         Returns:
             List of downloaded file paths
@@ -200,6 +211,9 @@ class DownloadService:
         downloaded_paths = []
 
         for i, attachment in enumerate(attachments):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+
             try:
                 file_path = self._download_attachment(
                     attachment,
@@ -464,7 +478,7 @@ if __name__ == "__main__":
     """Test download service."""
     from core.shotgrid_instance import ShotgridInstance
     from core.task_manager import TaskManager
-    from core.version_manger import VersionManager
+    from core.version_manager import VersionManager
 
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -488,7 +502,7 @@ if __name__ == "__main__":
         logger.info(f"Task: {task.get('content')} on {task.get('entity', {}).get('name')}")
 
         # Get latest version
-        versions = version_manager.get_versions_from_task(task_id)
+        versions = version_manager.get_versions_from_task(task_id, fields=VersionManager.full_fields)
 
         if versions:
             latest_version = versions[0]
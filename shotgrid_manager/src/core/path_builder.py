@@ -1,9 +1,11 @@
 import logging
-from typing import List
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import List, Optional, Union, TypedDict
 
-import shotgun_api3 as sg
 from core.shotgrid_instance import ShotgridInstance
 from utils.logger import setup_logging
+from utils import sg_cache
 
 import os
 
@@ -21,6 +23,74 @@ ASSETS_TYPE_MAP = {
 }
 
 
+# Task statuses that never get a work area
+EXCLUDED_TASK_STATUSES = ['omt', 'dlt']  # omitted, deleted
+
+# Fields needed to build a task path
+TASK_PATH_FIELDS = [
+    'content', 'project', 'id',
+    'entity', 'entity.Asset.sg_asset_type', 'entity.Asset.code'
+]
+
+# Shape of a Task row as returned by ShotGrid for TASK_PATH_FIELDS
+# (functional syntax since the deep-linked field names contain dots)
+TaskRow = TypedDict("TaskRow", {
+    "type": str,
+    "id": int,
+    "content": str,
+    "project": Optional[dict],
+    "entity": Optional[dict],
+    "entity.Asset.sg_asset_type": Optional[str],
+    "entity.Asset.code": Optional[str],
+}, total=False)
+
+
+@dataclass(frozen=True)
+class TaskView():
+    """
+    Flattened, slotted view of a TaskRow.
+    Converted once on ingestion so path building uses attribute access
+    instead of chained dict.get() calls.
+    """
+    __slots__ = ("id", "content", "project_name", "entity_type", "entity_name", "asset_type", "asset_code")
+
+    id: int
+    content: str
+    project_name: str
+    entity_type: str
+    entity_name: str
+    asset_type: str
+    asset_code: str
+
+    @classmethod
+    def from_dict(cls, row: TaskRow) -> "TaskView":
+        project = row["project"] if "project" in row and row["project"] else None
+        entity = row["entity"] if "entity" in row and row["entity"] else None
+        return cls(
+            id=row["id"] if "id" in row else None,
+            content=row["content"] if "content" in row and row["content"] else "",
+            project_name=project["name"] if project and "name" in project else "",
+            entity_type=entity["type"] if entity and "type" in entity else "",
+            entity_name=entity["name"] if entity and "name" in entity else "",
+            asset_type=row.get("entity.Asset.sg_asset_type") or "",
+            asset_code=row.get("entity.Asset.code") or "",
+        )
+
+
+def _asset_entity_name(task: TaskView) -> str:
+    """Asset tasks live under <AssetTypeFolder>/<AssetCode>."""
+    if task.asset_type and task.asset_code:
+        return f"{ASSETS_TYPE_MAP.get(task.asset_type)}/{task.asset_code}"
+    return ""
+
+
+# Entity type -> entity_name builder, replaces the if/elif chain per call
+_ENTITY_NAME_BUILDERS = {
+    "Asset": _asset_entity_name,
+    "Shot": lambda task: task.entity_name,
+}
+
+
 class PathBuilder():
     """
     Builds file system paths for Shotgun entities.
@@ -42,7 +112,7 @@ class PathBuilder():
         """Verify connection is active before operations."""
         self.manager.ensure_connected()
 
-    def get_path_from_task(self, task_id: int) -> str:
+    def get_path_from_task(self, task_id: int) -> Optional[PurePosixPath]:
         """
         Build file system path from task ID.
 
@@ -50,51 +120,58 @@ class PathBuilder():
             task_id: Shotgun task ID
 
         Returns:
-            Full path string, or empty string if unable to build path
+            Full path, or None if unable to build path
 
         Example:
             /WORK_AREA/ProjectName/ASSETS/Characters/CharName/TaskName
         """
         self._ensure_connected()
 
-        task = self.manager.instance.find_one(
-            entity_type="Task",
-            filters=[["id", "is", task_id]],
-            fields=[
-                'content', 'sg_versions', 'project', 'id',
-                'entity', 'entity.Asset.sg_asset_type', 'entity.Asset.code'
-            ]
-        )
+        # Shared with other components resolving the same task
+        task = sg_cache.get_task(self.manager, task_id, TASK_PATH_FIELDS)
 
         if not task:
             self.logger.error(f"Unable to find task with id {task_id}")
-            return ""
+            return None
+
+        return self._build_path_from_task_dict(task)
+
+    def _build_path_from_task_dict(self, task: TaskRow) -> Optional[PurePosixPath]:
+        """
+        Build file system path from an already fetched task dictionary.
+
+        Args:
+            task: Task dict with content, project, entity and entity.Asset.* fields
+
+        Returns:
+            Full path, or None if unable to build path
+        """
+        view = TaskView.from_dict(task)
+        task_id = view.id
+        entity_type = view.entity_type
+
+        builder = _ENTITY_NAME_BUILDERS.get(entity_type)
+        if builder is None:
+            self.logger.warning(f"Unable to build complete path for task {task_id}")
+            return None
 
         # Extract path components
-        task_name = task.get("content", "")
-        project = task.get("project", {}).get("name", "")
-        entity_type = task.get("entity", {}).get("type", "")
-
-        entity_name = ""
-        if entity_type == "Asset":
-            asset_type = task.get("entity.Asset.sg_asset_type", "")
-            asset_name = task.get("entity.Asset.code", "")
-            if asset_type and asset_name:
-                entity_name = f"{ASSETS_TYPE_MAP.get(asset_type)}/{asset_name}"
-
-        elif entity_type == "Shot":
-            entity_name = task.get("entity", {}).get("name", "")
-
-        # Build path
-        if task_name and project and entity_type and entity_name:
-            out_path = f"{WORK_AREA_PATH}/{project}/{ENTITY_TYPE_MAP.get(entity_type)}/{entity_name}/{task_name}"
+        task_name = view.content
+        project = view.project_name
+        entity_name = builder(view)
+
+        # Build path, WORK_AREA is required since a path can't be rooted on None
+        if WORK_AREA_PATH and task_name and project and entity_name:
+            out_path = PurePosixPath(
+                WORK_AREA_PATH, project, ENTITY_TYPE_MAP[entity_type], entity_name, task_name
+            )
             self.logger.debug(f"Built path for task {task_id}: {out_path}")
             return out_path
 
         self.logger.warning(f"Unable to build complete path for task {task_id}")
-        return ""
+        return None
 
-    def get_task_paths_from_asset(self, asset_id: int) -> List[str]:
+    def get_task_paths_from_asset(self, asset_id: int) -> List[PurePosixPath]:
         """
         Get all task paths for an asset.
 
@@ -102,35 +179,40 @@ class PathBuilder():
             asset_id: Shotgun asset ID
 
         Returns:
-            List of path strings for all tasks on the asset
+            List of paths for all tasks on the asset
         """
         self._ensure_connected()
 
-        asset = self.manager.instance.find_one(
-            entity_type="Asset",
-            filters=[["id", "is", asset_id]],
-            fields=["tasks"]
-        )
-
-        if not asset:
-            self.logger.warning(f"Asset {asset_id} not found")
+        # One hydrated Task query instead of Asset lookup + find_one per task,
+        # omitted/deleted tasks are filtered server-side
+        tasks = self.manager.instance.find(
+            entity_type="Task",
+            filters=[
+                ["entity", "is", {"type": "Asset", "id": asset_id}],
+                ["sg_status_list", "not_in", EXCLUDED_TASK_STATUSES]
+            ],
+            fields=TASK_PATH_FIELDS
+        ) or []
+
+        if not tasks:
+            self.logger.warning(f"No tasks found for asset {asset_id}")
             return []
 
         paths = []
-        for task in asset.get('tasks', []):
-            task_path = self.get_path_from_task(task.get("id"))
+        for task in tasks:
+            task_path = self._build_path_from_task_dict(task)
             if task_path:
                 paths.append(task_path)
 
         self.logger.info(f"Built {len(paths)} paths for asset {asset_id}")
         return paths
 
-    def create_path(self, file_path):
+    def create_path(self, file_path: Union[str, os.PathLike]):
         if file_path:
             os.makedirs(file_path, exist_ok=True)
             self.logger.info(f"path success!!: {file_path}")
         else:
-            raise FileExistsError("empty or invalid path provided. {file_path}")
+            raise FileExistsError(f"empty or invalid path provided. {file_path}")
     
 
 
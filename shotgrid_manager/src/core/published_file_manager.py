@@ -1,7 +1,7 @@
 from core.base_manager import BaseManager
 from core.path_builder import PathBuilder
 from utils.logger import setup_logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 
 
@@ -30,21 +30,40 @@ class PublishedFileManager(BaseManager):
         filters = [["project", "is", {"type":"Project", "id":project_id}]]
         return self.get_entities(filters=filters, fields=self.entity_fields)
     
+    def build_published_file_data(self, version_id:Optional[int], version_number:int, task_id, name:str, file_code:str, project_id:int, description:str="")->dict:
+        """Create payload for a PublishedFile, version_id None leaves the Version link for a later update."""
+        data = {
+            "project":{"type":"Project", "id":project_id},
+            "version_number":version_number,
+            "task":{"type":"Task", "id":task_id},
+            "name":name,
+            "code":file_code,
+            "description":description,
+        }
+        if version_id is not None:
+            data["version"] = {"type":"Version", "id":version_id}
+        return data
+
     def create_published_file(self, version_id:int, version_number:int, task_id, name:str, file_code:str, project_id:int, description:str="")->tuple[dict, dict]:
         published_file = self.create_entity(
-            data= {
-                "project":{"type":"Project", "id":project_id},
-                "version":{"type":"Version", "id":version_id},
-                "version_number":version_number,
-                "task":{"type":"Task", "id":task_id},
-                "name":name,
-                "code":file_code,
-                "description":description,
-            }
+            data=self.build_published_file_data(
+                version_id=version_id,
+                version_number=version_number,
+                task_id=task_id,
+                name=name,
+                file_code=file_code,
+                project_id=project_id,
+                description=description
+            )
         )
         return published_file
+
+    def create_published_files(self, data_list:List[dict])->List[dict]:
+        """Create several published files with one batch() call, results keep data_list order."""
+        return self.batch_create(data_list)
     
 
+
 if __name__ == "__main__":
     from core.shotgrid_instance import ShotgridInstance
     setup_logging()
@@ -17,19 +17,27 @@ Supports:
 """
 
 from typing import Optional, Dict, Union, List, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 import logging
 from pathlib import Path
 
 from core.shotgrid_instance import ShotgridInstance
 from core.task_manager import TaskManager
-from core.version_manger import VersionManager
+from core.version_manager import VersionManager
 from core.published_file_manager import PublishedFileManager
 from core.attachment_manager import AttachmentManager
 from utils.logger import setup_logging
 from utils.progress_tracker import ProgressTracker
 
 
+# Files above this size are uploaded with the streaming uploader
+STREAM_UPLOAD_THRESHOLD = 32 * 1024 * 1024  # 32 MB
+
+# Max concurrent stat() calls when validating files (cheap locally, slow on SMB/NFS)
+MAX_STAT_WORKERS = 16
+
+
 class PublishingError(Exception):
     """Custom exception for publishing errors"""
     pass
@@ -67,7 +75,9 @@ class PublishingService:
         task_id: int,
         file_path: str,
         description: str = "",
-        set_task_to_review: bool = True
+        set_task_to_review: bool = True,
+        task_data: Optional[Dict] = None,
+        use_batch: bool = False
     ) -> Dict:
         """
         Execute complete publishing workflow.
@@ -77,6 +87,9 @@ class PublishingService:
             file_path: Path to file to publish
             description: Optional description for the publish
             set_task_to_review: Whether to set task status to 'fin' (default: True)
+            task_data: Optional already fetched task dict (id, content, project, entity),
+                       skips the task query when provided
+            use_batch: Run steps 3-6 as two batch() requests instead of four calls
 
         Returns:
             Dictionary with publish results:
@@ -92,19 +105,19 @@ class PublishingService:
             PublishingError: If any step of the publishing process fails
             FileNotFoundError: If file_path doesn't exist
         """
-        self.logger.info(f"Starting publish workflow for task {task_id}, file: {file_path}")
+        self.logger.info("Starting publish workflow for task %s, file: %s", task_id, file_path)
+
+        # Parse path once, reused for the existence check and entity names
+        path_obj = Path(file_path)
 
         # Validate file exists
-        if not os.path.exists(file_path):
+        if not path_obj.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
             # Get task data
             self.logger.info("Fetching task data...")
-            task_data = self.task_manager.get_task(task_id=task_id)
-
-            if not task_data:
-                raise PublishingError(f"Task {task_id} not found")
+            task_data = self._resolve_task_data(task_id, task_data)
 
             # Extract task info
             project_id = task_data.get("project", {}).get("id", -1)
@@ -112,65 +125,84 @@ class PublishingService:
             task_name = task_data.get('content', 'Task')
             entity_name = entity_data.get('name', 'Unknown') if entity_data else 'Unknown'
 
-            self.logger.info(f"Task: {task_name}, Entity: {entity_name}, Project ID: {project_id}")
+            self.logger.info("Task: %s, Entity: %s, Project ID: %s", task_name, entity_name, project_id)
 
             # Step 1: Upload attachment to project
             self.logger.info("Step 1/6: Uploading attachment to project...")
 
             attachment_id = self.upload_attachment(project_id, file_path)
-            self.logger.info(f"  ✓ Attachment uploaded (ID: {attachment_id})")
+            self.logger.info("  ✓ Attachment uploaded (ID: %s)", attachment_id)
 
             # Step 2: Determine version number
             self.logger.info("Step 2/6: Determining version number...")
             version_number = self.version_manager.get_next_version_number_for_task(task_id)
-            self.logger.info(f"  ✓ Version number: {version_number}")
+            self.logger.info("  ✓ Version number: %s", version_number)
 
-            # Step 3: Create Version entity
-            self.logger.info("Step 3/6: Creating Version entity...")
-            version = self.create_version(
-                task_id=task_id,
-                project_id=project_id,
-                version_number=version_number,
-                entity_name=entity_name,
-                task_name=task_name,
-                description=description
-            )
-            version_id = version.get("id", -1)
-            self.logger.info(f"  ✓ Version created (ID: {version_id}, Code: {version.get('code')})")
+            if use_batch:
+                # Steps 3-6: Version, PublishedFile, Task status and attachment links in two batch requests
+                self.logger.info("Steps 3-6/6: Creating Version, PublishedFile and links in batch...")
+                version, published_file, updated_attachment, updated_task = self._publish_batched(
+                    task_id=task_id,
+                    project_id=project_id,
+                    attachment_id=attachment_id,
+                    version_number=version_number,
+                    entity_name=entity_name,
+                    task_name=task_name,
+                    description=description,
+                    set_task_to_review=set_task_to_review,
+                    path_obj=path_obj
+                )
+                version_id = version['id']
+                published_file_id = published_file['id']
+            else:
+                # Step 3: Create Version entity
+                self.logger.info("Step 3/6: Creating Version entity...")
+                version = self.create_version(
+                    task_id=task_id,
+                    project_id=project_id,
+                    version_number=version_number,
+                    entity_name=entity_name,
+                    task_name=task_name,
+                    description=description
+                )
+                version_id = version.get("id", -1)
+                self.logger.info("  ✓ Version created (ID: %s, Code: %s)", version_id, version.get('code'))
 
-            # Step 4: Create PublishedFile entity
-            self.logger.info("Step 4/6: Creating PublishedFile entity...")
-            published_file = self.create_published_file(
-                version_id=version_id,
-                task_id=task_id,
-                project_id=project_id,
-                file_path=file_path,
-                entity_name=entity_name,
-                task_name=task_name,
-                version_number=version_number
-            )
-            published_file_id = published_file['id']
-            self.logger.info(f"  ✓ PublishedFile created (ID: {published_file_id}, Code: {published_file.get('code')})")
+                # Step 4: Create PublishedFile entity
+                self.logger.info("Step 4/6: Creating PublishedFile entity...")
+                published_file = self.create_published_file(
+                    version_id=version_id,
+                    task_id=task_id,
+                    project_id=project_id,
+                    file_path=file_path,
+                    entity_name=entity_name,
+                    task_name=task_name,
+                    version_number=version_number,
+                    _stem=path_obj.stem
+                )
+                published_file_id = published_file['id']
+                self.logger.info("  ✓ PublishedFile created (ID: %s, Code: %s)", published_file_id, published_file.get('code'))
 
-            # Step 5: Update attachment with metadata
-            self.logger.info("Step 5/6: Updating attachment metadata...")
-            updated_attachment = self.update_attachment_links(
-                attachment_id=attachment_id,
-                task_id=task_id,
-                version_id=version_id,
-                published_file_id=published_file_id,
-                file_path=file_path
-            )
-            self.logger.info(f"  ✓ Attachment metadata updated")
+                # Step 5: Update attachment with metadata
+                self.logger.info("Step 5/6: Updating attachment metadata...")
+                updated_attachment = self.update_attachment_links(
+                    attachment_id=attachment_id,
+                    task_id=task_id,
+                    version_id=version_id,
+                    published_file_id=published_file_id,
+                    file_path=file_path,
+                    _name=path_obj.name
+                )
+                self.logger.info("  ✓ Attachment metadata updated")
 
-            # Step 6: Set task to revision status
-            updated_task = None
-            if set_task_to_review:
-                self.logger.info("Step 6/6: Setting task to revision status...")
-                updated_task = self.set_task_to_review(task_id)
-                self.logger.info(f"  ✓ Task status updated to 'fin'")
-            else:
-                self.logger.info("Step 6/6: Skipping task status update (set_task_to_review=False)")
+                # Step 6: Set task to revision status
+                updated_task = None
+                if set_task_to_review:
+                    self.logger.info("Step 6/6: Setting task to revision status...")
+                    updated_task = self.set_task_to_review(task_id)
+                    self.logger.info("  ✓ Task status updated to 'fin'")
+                else:
+                    self.logger.info("Step 6/6: Skipping task status update (set_task_to_review=False)")
 
             # Return complete publish data
             result = {
@@ -181,9 +213,9 @@ class PublishingService:
                 'task': updated_task
             }
 
-            self.logger.info(f"✓ Publishing completed successfully!")
-            self.logger.info(f"  - Version: {version.get('code')} (ID: {version_id})")
-            self.logger.info(f"  - PublishedFile: {published_file.get('code')} (ID: {published_file_id})")
+            self.logger.info("✓ Publishing completed successfully!")
+            self.logger.info("  - Version: %s (ID: %s)", version.get('code'), version_id)
+            self.logger.info("  - PublishedFile: %s (ID: %s)", published_file.get('code'), published_file_id)
 
             return result
 
@@ -198,7 +230,8 @@ class PublishingService:
         file_paths: List[str],
         description: str = "",
         set_task_to_review: bool = True,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        task_data: Optional[Dict] = None
     ) -> Dict:
         """
         Publish multiple files under one version.
@@ -214,6 +247,8 @@ class PublishingService:
             set_task_to_review: Whether to set task status to 'fin' (default: True)
             progress_callback: Optional callback function(current_step, total_steps, message)
                               Called at each step to report progress
+            task_data: Optional already fetched task dict (id, content, project, entity),
+                       skips the task query when provided
 
         Returns:
             Dictionary with publish results:
@@ -221,7 +256,7 @@ class PublishingService:
                 'version': version_dict,
                 'version_number': int,
                 'published_files': [pub_file_dict, ...],
-                'attachments': [attachment_dict, ...],
+                'attachments': [{'id', 'file_path', 'file_size'}, ...],
                 'task': updated_task_dict (if set_task_to_review=True)
             }
 
@@ -238,11 +273,11 @@ class PublishingService:
             ... )
             >>> print(f"Published {len(result['published_files'])} files")
         """
-        self.logger.info(f"Starting multi-file publish for task {task_id}")
-        self.logger.info(f"Files to publish: {len(file_paths)}")
+        self.logger.info("Starting multi-file publish for task %s", task_id)
+        self.logger.info("Files to publish: %s", len(file_paths))
 
         # Calculate total steps for progress
-        total_steps = len(file_paths) * 2 + 4  # Upload + create pub file for each + 4 steps
+        total_steps = len(file_paths) + 5  # Upload for each + 5 steps
 
         # Create progress tracker
         tracker = ProgressTracker(
@@ -251,18 +286,13 @@ class PublishingService:
             logger=self.logger
         )
 
-        # Validate all files exist first
-        for file_path in file_paths:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
+        # Validate all files exist first, sizes are kept for the upload step
+        file_sizes = self._stat_files(file_paths)
 
         try:
             # Get task data
             tracker.step("Fetching task data...")
-            task_data = self.task_manager.get_task(task_id=task_id)
-
-            if not task_data:
-                raise PublishingError(f"Task {task_id} not found")
+            task_data = self._resolve_task_data(task_id, task_data)
 
             # Extract task info
             project_id = task_data.get("project", {}).get("id", -1)
@@ -270,22 +300,35 @@ class PublishingService:
             task_name = task_data.get('content', 'Task')
             entity_name = entity_data.get('name', 'Unknown') if entity_data else 'Unknown'
 
-            self.logger.info(f"Task: {task_name}, Entity: {entity_name}, Project ID: {project_id}")
+            self.logger.info("Task: %s, Entity: %s, Project ID: %s", task_name, entity_name, project_id)
 
-            # Step 1: Upload all attachments
-            attachment_data = []
-            for i, file_path in enumerate(file_paths):
-                tracker.step(f"Uploading attachment {i+1}/{len(file_paths)}: {os.path.basename(file_path)}")
-                attachment_id = self.upload_attachment(project_id, file_path)
-                attachment_data.append({
-                    'id': attachment_id,
-                    'file_path': file_path
-                })
+            # Step 1: Upload all attachments concurrently on the shared io executor
+            # (network bound, its threads keep their Shotgun clients between publishes)
+            attachment_data = [None] * len(file_paths)
+            futures = {
+                self.sg_instance.io_executor.submit(self.upload_attachment, project_id, file_path, file_sizes[i]): i
+                for i, file_path in enumerate(file_paths)
+            }
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    file_path = file_paths[i]
+                    attachment_data[i] = {
+                        'id': future.result(),
+                        'file_path': file_path,
+                        'file_size': file_sizes[i]
+                    }
+                    tracker.step(f"Uploaded attachment {i+1}/{len(file_paths)}: {os.path.basename(file_path)}")
+            except Exception:
+                # Don't start queued uploads for a publish that already failed
+                for future in futures:
+                    future.cancel()
+                raise
 
             # Step 2: Get next version number
             tracker.step("Determining version number...")
             version_number = self.version_manager.get_next_version_number_for_task(task_id)
-            self.logger.info(f"Version number: {version_number}")
+            self.logger.info("Version number: %s", version_number)
 
             # Step 3: Create Version entity (ONE version for all files)
             tracker.step(f"Creating version v{version_number:03d}...")
@@ -298,35 +341,22 @@ class PublishingService:
                 description=description
             )
             version_id = version['id']
-            self.logger.info(f"Version created: {version.get('code')} (ID: {version_id})")
-
-            # Step 4: Create PublishedFile for each attachment
-            published_files = []
-            for i, att_data in enumerate(attachment_data):
-                tracker.step(f"Creating published file {i+1}/{len(attachment_data)}")
+            self.logger.info("Version created: %s (ID: %s)", version.get('code'), version_id)
 
-                # Create published file
-                pub_file = self.create_published_file(
-                    version_id=version_id,
-                    task_id=task_id,
-                    project_id=project_id,
-                    file_path=att_data['file_path'],
-                    entity_name=entity_name,
-                    task_name=task_name,
-                    version_number=version_number
-                )
-
-                # Update attachment links
-                self.update_attachment_links(
-                    attachment_id=att_data['id'],
-                    task_id=task_id,
-                    version_id=version_id,
-                    published_file_id=pub_file['id'],
-                    file_path=att_data['file_path']
-                )
-
-                published_files.append(pub_file)
-                self.logger.info(f"PublishedFile created: {pub_file.get('code')} (ID: {pub_file['id']})")
+            # Step 4: Create all PublishedFiles and link attachments in batch calls
+            tracker.step(f"Creating {len(attachment_data)} published files...")
+            published_files = self.batch_create_and_link(
+                attachment_data=attachment_data,
+                version_id=version_id,
+                task_id=task_id,
+                project_id=project_id,
+                entity_name=entity_name,
+                task_name=task_name,
+                version_number=version_number
+            )
+            if self.logger.isEnabledFor(logging.INFO):
+                for pub_file in published_files:
+                    self.logger.info("PublishedFile created: %s (ID: %s)", pub_file.get('code'), pub_file['id'])
 
             # Step 5: Set task to review (optional)
             updated_task = None
@@ -344,9 +374,9 @@ class PublishingService:
                 'task': updated_task
             }
 
-            self.logger.info(f"✓ Multi-file publish completed successfully!")
-            self.logger.info(f"  - Version: {version.get('code')} (ID: {version_id})")
-            self.logger.info(f"  - Published Files: {len(published_files)}")
+            self.logger.info("✓ Multi-file publish completed successfully!")
+            self.logger.info("  - Version: %s (ID: %s)", version.get('code'), version_id)
+            self.logger.info("  - Published Files: %s", len(published_files))
 
             return result
 
@@ -355,17 +385,83 @@ class PublishingService:
             self.logger.error(error_msg)
             raise PublishingError(error_msg) from e
 
+    def _stat_files(self, file_paths: List[str]) -> List[int]:
+        """
+        Stat all files concurrently and return their sizes.
+
+        Args:
+            file_paths: Paths to validate
+
+        Returns:
+            File sizes in bytes, in file_paths order
+
+        Raises:
+            FileNotFoundError: On the first path that doesn't exist
+        """
+        def file_size(file_path: str) -> Optional[int]:
+            try:
+                return os.stat(file_path).st_size
+            except FileNotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_STAT_WORKERS, len(file_paths)))) as executor:
+            file_sizes = list(executor.map(file_size, file_paths))
+
+        for file_path, size in zip(file_paths, file_sizes):
+            if size is None:
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+        return file_sizes
+
+    def _resolve_task_data(self, task_id: int, task_data: Optional[Dict] = None) -> Dict:
+        """
+        Return caller provided task data, or fetch the task when none was given.
+
+        Args:
+            task_id: Task ID being published
+            task_data: Optional already fetched task dict
+
+        Returns:
+            Task dictionary
+
+        Raises:
+            PublishingError: If the task is not found or task_data doesn't match task_id
+        """
+        if task_data is None:
+            task_data = self.task_manager.get_task(task_id=task_id)
+            if not task_data:
+                raise PublishingError(f"Task {task_id} not found")
+            return task_data
+
+        if task_data.get('id') != task_id:
+            raise PublishingError(f"task_data id {task_data.get('id')} does not match task {task_id}")
+
+        missing = [key for key in ('project', 'entity', 'content') if key not in task_data]
+        if missing or not (task_data['project'] or {}).get('id'):
+            raise PublishingError(f"task_data for task {task_id} is missing fields: {missing or ['project.id']}")
+
+        return task_data
+
     # ===================================================================
     # Public Methods - Individual Workflow Steps
     # ===================================================================
 
-    def upload_attachment(self, project_id: int, file_path: str) -> int:
+    def upload_attachment(self, project_id: int, file_path: str, file_size: Optional[int] = None) -> int:
         """
         Upload file attachment to project; 
-        shotgun upload function returns only the attachment id
+        shotgun upload function returns only the attachment id.
+        Files larger than STREAM_UPLOAD_THRESHOLD are streamed instead of read into memory.
         """
         try:
-            attachment_id = self.attachment_manager.upload_attachment_to_project(
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
+
+            if file_size > STREAM_UPLOAD_THRESHOLD:
+                upload = self.attachment_manager.upload_attachment_to_project_stream
+            else:
+                upload = self.attachment_manager.upload_attachment_to_project
+
+            attachment_id = upload(
                 project_id=project_id,
                 file_path=file_path
             )
@@ -401,28 +497,20 @@ class PublishingService:
         Returns:
             Created version dictionary
         """
-        # Format version number with padding (v001, v002, etc.)
-        version_str = f"v{version_number:03d}"
+        version_name, version_code = self._version_names(version_number, entity_name, task_name)
 
-        # Build names: EntityName_TaskName_v###
-        version_name = f"{entity_name}__{task_name}__{version_str}"
-        version_code = version_str
+        # Description goes in the create payload, no follow-up update needed
+        extra_fields = {'description': description} if description else {}
 
         try:
             version = self.version_manager.create_version(
                 task_id=task_id,
                 name=version_name,
                 version_code=version_code,
-                project_id=project_id
+                project_id=project_id,
+                **extra_fields
             )
 
-            # Add description if provided
-            if description:
-                version = self.version_manager.update_version(
-                    version_id=version.get("id", -1),
-                    data_to_update={'description': description}
-                )
-
             return version
 
         except Exception as e:
@@ -437,7 +525,8 @@ class PublishingService:
         entity_name: str,
         task_name: str,
         version_number: int,
-        description:str=""
+        description:str="",
+        _stem: Optional[str] = None
     ) -> Dict:
         """
         Create PublishedFile entity in ShotGrid.
@@ -450,16 +539,14 @@ class PublishingService:
             entity_name: Entity name
             task_name: Task name
             version_number: Version number
+            _stem: Precomputed file stem, skips parsing file_path again
 
         Returns:
             Created published file dictionary
         """
-        file_stem = Path(file_path).stem
-
-        # Published file name and code
-        version_str = f"v{version_number:03d}"
-        published_name = f"{entity_name}_{task_name}_{version_str}"
-        published_code = f"{file_stem}.{version_str}"
+        published_name, published_code = self._published_file_names(
+            file_path, entity_name, task_name, version_number, _stem=_stem
+        )
 
         try:
             published_file = self.published_file_manager.create_published_file(
@@ -483,7 +570,8 @@ class PublishingService:
         task_id: int,
         version_id: int,
         published_file_id: int,
-        file_path: str
+        file_path: str,
+        _name: Optional[str] = None
     ) -> Dict:
         """
         Update attachment with task, version, published file links and metadata.
@@ -494,22 +582,14 @@ class PublishingService:
             version_id: Version ID to link
             published_file_id: PublishedFile ID to link
             file_path: File path (for extracting filename and extension)
+            _name: Precomputed file name, skips parsing file_path again
 
         Returns:
             Updated attachment dictionary
         """
-        # Extract file info
-        file_path_obj = Path(file_path)
-        original_filename = file_path_obj.name
-        # Build update data
-        update_data = {
-            'original_fname': original_filename,
-            'attachment_links': [
-                {'type': 'Task', 'id': task_id},
-                {'type': 'Version', 'id': version_id},
-                {'type': 'PublishedFile', 'id': published_file_id}
-            ]
-        }
+        update_data = self._attachment_link_data(
+            task_id, version_id, published_file_id, file_path, _name=_name
+        )
 
         try:
             updated_attachment = self.attachment_manager.update_entity(
@@ -522,6 +602,214 @@ class PublishingService:
         except Exception as e:
             raise PublishingError(f"Failed to update attachment metadata: {str(e)}") from e
 
+    def batch_create_and_link(
+        self,
+        attachment_data: List[Dict],
+        version_id: int,
+        task_id: int,
+        project_id: int,
+        entity_name: str,
+        task_name: str,
+        version_number: int
+    ) -> List[Dict]:
+        """
+        Create PublishedFiles for uploaded attachments and link the attachments to them.
+
+        Uses one batch() call for all PublishedFile creates and one for all
+        Attachment updates (Shotgun batch can't reference ids created in the same call).
+
+        Args:
+            attachment_data: List of {'id': attachment_id, 'file_path': str}
+            version_id: Version ID to link to
+            task_id: Task ID
+            project_id: Project ID
+            entity_name: Entity name
+            task_name: Task name
+            version_number: Version number
+
+        Returns:
+            Created published file dictionaries, in attachment_data order
+        """
+        # Parse each path once for both the PublishedFile code and the attachment name
+        path_objs = [Path(att_data['file_path']) for att_data in attachment_data]
+
+        pub_file_data = []
+        for att_data, path_obj in zip(attachment_data, path_objs):
+            published_name, published_code = self._published_file_names(
+                att_data['file_path'], entity_name, task_name, version_number, _stem=path_obj.stem
+            )
+            pub_file_data.append(self.published_file_manager.build_published_file_data(
+                version_id=version_id,
+                version_number=version_number,
+                task_id=task_id,
+                name=published_name,
+                file_code=published_code,
+                project_id=project_id
+            ))
+
+        try:
+            published_files = self.published_file_manager.create_published_files(pub_file_data)
+        except Exception as e:
+            raise PublishingError(f"Failed to create published files: {str(e)}") from e
+
+        try:
+            self.attachment_manager.update_attachments([
+                (
+                    att_data['id'],
+                    self._attachment_link_data(
+                        task_id, version_id, pub_file['id'], att_data['file_path'], _name=path_obj.name
+                    )
+                )
+                for att_data, path_obj, pub_file in zip(attachment_data, path_objs, published_files)
+            ])
+        except Exception as e:
+            raise PublishingError(f"Failed to update attachment metadata: {str(e)}") from e
+
+        return published_files
+
+    def _publish_batched(
+        self,
+        task_id: int,
+        project_id: int,
+        attachment_id: int,
+        version_number: int,
+        entity_name: str,
+        task_name: str,
+        description: str,
+        set_task_to_review: bool,
+        path_obj: Path
+    ) -> tuple:
+        """
+        Create Version and PublishedFile, link them and update the task with two batch() calls.
+
+        Shotgun batch can't reference entities created earlier in the same request, so:
+          batch 1: create Version, create PublishedFile
+          batch 2: link PublishedFile to the Version, update Attachment links, update Task status
+
+        The Task status is set last, as in the sequential path, so a failed link never
+        leaves the task flagged for review with an unlinked PublishedFile.
+
+        Returns:
+            (version, published_file, updated_attachment, updated_task)
+        """
+        version_name, version_code = self._version_names(version_number, entity_name, task_name)
+        published_name, published_code = self._published_file_names(
+            str(path_obj), entity_name, task_name, version_number, _stem=path_obj.stem
+        )
+
+        extra_fields = {'description': description} if description else {}
+        batch_requests = [
+            {
+                'request_type': 'create',
+                'entity_type': 'Version',
+                'data': self.version_manager.build_version_data(
+                    task_id=task_id,
+                    name=version_name,
+                    version_code=version_code,
+                    project_id=project_id,
+                    **extra_fields
+                )
+            },
+            {
+                'request_type': 'create',
+                'entity_type': 'PublishedFile',
+                # Version link is set in batch 2, once the Version id is known
+                'data': self.published_file_manager.build_published_file_data(
+                    version_id=None,
+                    version_number=version_number,
+                    task_id=task_id,
+                    name=published_name,
+                    file_code=published_code,
+                    project_id=project_id
+                )
+            }
+        ]
+
+        try:
+            version, published_file = self.version_manager.batch(batch_requests)
+        except Exception as e:
+            raise PublishingError(f"Failed to create version and published file: {str(e)}") from e
+
+        link_requests = [
+            {
+                'request_type': 'update',
+                'entity_type': 'PublishedFile',
+                'entity_id': published_file['id'],
+                'data': {'version': {'type': 'Version', 'id': version['id']}}
+            },
+            {
+                'request_type': 'update',
+                'entity_type': 'Attachment',
+                'entity_id': attachment_id,
+                'data': self._attachment_link_data(
+                    task_id, version['id'], published_file['id'], str(path_obj), _name=path_obj.name
+                )
+            }
+        ]
+        if set_task_to_review:
+            # BaseManager.batch evicts the cached task reads for this update
+            link_requests.append({
+                'request_type': 'update',
+                'entity_type': 'Task',
+                'entity_id': task_id,
+                'data': {'sg_status_list': 'fin'}
+            })
+
+        try:
+            results = self.version_manager.batch(link_requests)
+        except Exception as e:
+            raise PublishingError(f"Failed to link published file and attachment: {str(e)}") from e
+
+        published_file_update, updated_attachment = results[0], results[1]
+        updated_task = results[2] if set_task_to_review else None
+
+        published_file.update(published_file_update)
+        return version, published_file, updated_attachment, updated_task
+
+    def _version_names(self, version_number: int, entity_name: str, task_name: str) -> tuple:
+        """Build (name, code) for a Version, e.g. ('Asset__Task__v001', 'v001')."""
+        # Format version number with padding (v001, v002, etc.)
+        version_str = f"v{version_number:03d}"
+
+        # Build names: EntityName_TaskName_v###
+        version_name = f"{entity_name}__{task_name}__{version_str}"
+        return version_name, version_str
+
+    def _published_file_names(
+        self,
+        file_path: str,
+        entity_name: str,
+        task_name: str,
+        version_number: int,
+        _stem: Optional[str] = None
+    ) -> tuple:
+        """Build (name, code) for a PublishedFile, e.g. ('Asset_Task_v001', 'scene.v001')."""
+        file_stem = _stem if _stem is not None else Path(file_path).stem
+
+        version_str = f"v{version_number:03d}"
+        published_name = f"{entity_name}_{task_name}_{version_str}"
+        published_code = f"{file_stem}.{version_str}"
+
+        return published_name, published_code
+
+    def _attachment_link_data(
+        self,
+        task_id: int,
+        version_id: int,
+        published_file_id: int,
+        file_path: str,
+        _name: Optional[str] = None
+    ) -> Dict:
+        """Build Attachment update data linking it to task, version and published file."""
+        return {
+            'original_fname': _name if _name is not None else Path(file_path).name,
+            'attachment_links': [
+                {'type': 'Task', 'id': task_id},
+                {'type': 'Version', 'id': version_id},
+                {'type': 'PublishedFile', 'id': published_file_id}
+            ]
+        }
+
     def set_task_to_review(self, task_id: int) -> Dict:
         """
         Set task status to 'fin' (Pending Review).
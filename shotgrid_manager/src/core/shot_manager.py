@@ -1,12 +1,26 @@
 from core.base_manager import BaseManager
 from utils.logger import setup_logging
+from typing import List, Optional
 import logging
 
 
 
 class ShotManager(BaseManager):
     entity = "Shot"
-    entity_fields = ["id", "code", "tasks", "assets", "sg_versions", "sg_published_files"]
+    # multi-entity fields are server side joins, only request them when needed
+    minimal_fields = ["id", "code"]
+    full_fields = ["id", "code", "tasks", "assets", "sg_versions", "sg_published_files"]
+    entity_fields = minimal_fields
+
+    def get_entities(self, filters: list, fields: Optional[List[str]] = None, order: List[dict] = None,
+                     limit: Optional[int] = None, page: int = 1) -> List[dict]:
+        """
+        Query shots, defaults to minimal_fields.
+        Pass fields=ShotManager.full_fields to get linked tasks, assets, versions and published files.
+        """
+        return super().get_entities(
+            filters=filters, fields=fields or self.minimal_fields, order=order, limit=limit, page=page
+        )
 
     def create_shot(self, project_id:int, name:str, task_template:dict=None)->dict:
         """
@@ -60,7 +74,7 @@ if __name__ == "__main__":
             ["project", "is", {"type":"Project", "id": 124}], 
             ["code", "is", "sq010_010"]
         ],
-        fields=shot_manager.entity_fields
+        fields=ShotManager.minimal_fields
     )
 
     flow.disconnect()
@@ -2,26 +2,555 @@
     Manages persistent connection to Shotgun.
     Connection is opened once and maintained throughout the application lifecycle.
     All managers share the same connection instance via composition pattern.
+    shotgun_api3 clients are not thread safe, so threads other than the one that
+    called connect() transparently get their own client built from the same credentials.
+    Those clients are leased from a bounded pool and handed back when the thread exits.
+    All Shotgun clients and direct HTTP calls (e.g. streamed uploads) go through one
+    pooled requests.Session so they reuse keep-alive connections.
+    ShotgridInstance is a process-wide singleton, every ShotgridInstance() call returns
+    the same object so the connection is only established once.
 '''
 import os
-import shotgun_api3 as sg
+import asyncio
+import functools
+
+# shotgun_api3 reads this once at import time: send entity dicts in filters/data
+# as bare {type, id} instead of the full dict (name, etc.). Must be set before the
+# (lazy) shotgun_api3 import.
+os.environ.setdefault("SHOTGUN_API_ENABLE_ENTITY_OPTIMIZATION", "1")
+
+import http.client
+import queue
+import random
+import socket
+import threading
+import time
+import weakref
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import logging
-from utils.logger import setup_logging
+
+# Connection pool sizes for the shared requests.Session, sized above the worker
+# pools (find_many, publish uploads) so parallel calls never wait for a socket
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 20
+
+# Default per-request timeout (seconds) and retries for connect()
+DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_RETRIES = 3
+
+# Gateway errors worth retrying; shotgun API calls are POSTs, which urllib3 only
+# retries on connection errors, so creates are never sent twice
+RETRY_STATUS_CODES = [502, 503, 504]
+
+# find() responses are verbose JSON, ask for compressed bodies (requests/httpx decompress them)
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Opt-in HTTP/2 transport (SG_HTTP2=1, needs httpx[http2]): the API calls of every
+# thread are multiplexed over a few connections instead of one socket per request
+HTTP2_ENABLED = os.getenv("SG_HTTP2", "0") == "1"
+HTTP2_MAX_CONNECTIONS = 20
+HTTP2_MAX_KEEPALIVE = 10
+
+# Exponential backoff with jitter for transient failures when building clients and reading
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRY_JITTER = 0.5
+
+# Pipeline steps rarely change, cached for this long (seconds)
+STEP_CACHE_TTL = 600
+DEFAULT_STEP_FIELDS = [
+    'code', 'description', 'color', 'short_name', 'department', 'list_order', 'entity_type',
+    'cached_display_name', 'updated_by', 'created_by', 'created_at', 'updated_at', 'id'
+]
+
+# Shared worker pool for independent read queries (find_many)
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sg_find")
+
+# Shared worker pool for uploads/downloads, long-lived so its threads keep their clients
+IO_WORKERS = 8
+_io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="sg_io")
+
+# Idle worker-thread clients kept for reuse, extras are closed when their thread exits
+WORKER_CLIENT_POOL_SIZE = 8
+
+
+# SG_URL -> [client, refcount], one main Shotgun client per site for the whole process
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _connection_errors():
+    """
+    Exceptions raised by a failed connect/disconnect.
+
+    Socket/SSL errors (OSError), requests transport errors and shotgun_api3 errors
+    (AuthenticationFault, ProtocolError, ...); anything else is a programming error
+    and propagates unchanged.
+
+    Returns:
+        tuple: Exception classes for an except clause
+    """
+    import shotgun_api3 as sg
+    return (OSError, requests.RequestException, sg.ShotgunError)
+
+
+SGCreds = namedtuple("SGCreds", "url script_name api_key")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_credentials(env_values):
+    """
+    Validate credentials once per distinct environment snapshot.
+
+    Args:
+        env_values: (SG_URL, SG_SCRIPT_NAME, SG_SCRIPT_KEY) as read from os.environ
+
+    Returns:
+        SGCreds: Validated credentials
+
+    Raises:
+        ValueError: If environment variables are missing (not cached, so a later call can succeed)
+    """
+    if not all(env_values):
+        raise ValueError(
+            "Missing required environment variables: SG_URL, SG_SCRIPT_NAME, SG_SCRIPT_KEY"
+        )
+    return SGCreds(*env_values)
+
+
+def _sg_credentials():
+    """
+    Shotgun credentials from the environment.
+    Keyed by the current values, so changing the env vars between connects is picked up.
+
+    Returns:
+        SGCreds: (url, script_name, api_key)
+    """
+    environ = os.environ
+    return _load_credentials((environ.get('SG_URL'), environ.get('SG_SCRIPT_NAME'), environ.get('SG_SCRIPT_KEY')))
+
+
+class _CachedEntity(dict):
+    """Entity dict that can be held in a WeakValueDictionary (plain dicts can't be weakly referenced)."""
+    __slots__ = ("__weakref__",)
+
+
+class _ClientLease():
+    """
+    A worker thread's pooled client, held in thread-local storage.
+    Collected when the thread exits, which hands the client back to the pool.
+    """
+    __slots__ = ("client", "generation", "__weakref__")
+
+    def __init__(self, client, generation):
+        self.client = client
+        self.generation = generation
+
 
 class ShotgridInstance():
 
     logger = logging.getLogger(__name__)
 
+    _singleton = None
+    _singleton_lock = threading.Lock()
+
+    # Fixed attribute layout, faster attribute access on the per-request connection check
+    __slots__ = (
+        "_initialized", "_connect_lock", "_instance", "_connected", "_credentials",
+        "_owner_thread", "_session", "_http2_client", "_timeout", "_max_retries", "_async_locks",
+        "_context_refs", "_context_owned", "_context_lock", "_entity_cache", "_step_cache", "_projects", "_users",
+        "_thread_clients", "_generation", "_client_pool", "_leases",
+    )
+
+    def __new__(cls):
+        # Double-checked locking, the lock is only taken while the singleton is created
+        if cls._singleton is None:
+            with cls._singleton_lock:
+                if cls._singleton is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._singleton = instance
+        return cls._singleton
+
     def __init__(self):
-        setup_logging()
-        self.instance = None
-        self._is_connected = False
+        # __init__ runs on every ShotgridInstance() call, only the first one initializes
+        if self._initialized:
+            return
+        self._initialized = True
+
+        self._connect_lock = threading.Lock()
+        self._instance = None
+        # Single source of truth for connection state, only set once _instance is ready
+        self._connected = False
+        self._credentials = None
+        self._owner_thread = None
+        self._session = None
+        # httpx.Client when SG_HTTP2 is enabled, None otherwise
+        self._http2_client = None
+        self._timeout = DEFAULT_TIMEOUT
+        self._max_retries = DEFAULT_MAX_RETRIES
+
+        # One asyncio.Lock per event loop, a lock binds to the first loop that waits on it
+        # so connect_async callers on a later asyncio.run loop need their own
+        self._async_locks = weakref.WeakKeyDictionary()
+
+        # Nested `with ShotgridInstance()` blocks, the last one to exit disconnects only
+        # if the outermost block opened the connection (not an earlier plain connect())
+        self._context_refs = 0
+        self._context_owned = False
+        self._context_lock = threading.Lock()
+
+        # (type, id) -> entity dict, entries live as long as a caller still holds the dict
+        self._entity_cache = weakref.WeakValueDictionary()
+
+        # (fetched_at, frozenset(fields), steps) from the last get_steps query
+        self._step_cache = None
+
+        # id -> {"id", "name"} for every Project / HumanUser, filled in by _warmup
+        self._projects = {}
+        self._users = {}
+
+        # Per-thread client leases for worker threads, generation guards against stale clients after reconnect
+        self._thread_clients = threading.local()
+        self._generation = 0
+        # Idle clients returned by exited threads, and the leases still held by live threads
+        self._client_pool = queue.LifoQueue(maxsize=WORKER_CLIENT_POOL_SIZE)
+        self._leases = weakref.WeakSet()
+
+    @staticmethod
+    def ref(entity_type, entity_id):
+        """
+        Minimal entity dict for filters and link fields.
+
+        Args:
+            entity_type: Shotgun entity type
+            entity_id: Entity id
+
+        Returns:
+            dict: {"id": entity_id, "type": entity_type}, without name or other extra keys
+        """
+        return {"id": entity_id, "type": entity_type}
+
+    def __enter__(self):
+        with self._context_lock:
+            if self._context_refs == 0:
+                self._context_owned = not self._connected
+            self._context_refs += 1
+        try:
+            self.connect()
+        except Exception:
+            # __exit__ won't run for a failed __enter__
+            with self._context_lock:
+                self._context_refs -= 1
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._context_lock:
+            self._context_refs -= 1
+            last_ref = self._context_refs == 0
+            owned = last_ref and self._context_owned
+            if last_ref:
+                self._context_owned = False
+        # The application's shared connection (opened with connect()) stays open
+        if owned:
+            self.disconnect()
+        return False
 
-    def connect(self):
+    @property
+    def instance(self):
+        """
+        Shotgun client for the calling thread.
+
+        Returns:
+            The main client when called from the connecting thread, a per-thread client
+            leased from the pool otherwise, or None if not connected
+        """
+        if self._instance is None or threading.get_ident() == self._owner_thread:
+            return self._instance
+
+        local = self._thread_clients
+        lease = getattr(local, "lease", None)
+        if lease is None or lease.generation != self._generation:
+            # Replacing a stale lease collects it, which closes its client
+            lease = local.lease = self._checkout_client()
+        return lease.client
+
+    def _checkout_client(self):
+        """
+        Lease an idle pooled client to the calling thread, creating one if the pool is empty.
+
+        Returns:
+            _ClientLease: Handed back to the pool by _checkin_client once the thread drops it
+        """
+        generation = self._generation
+        try:
+            client = self._client_pool.get_nowait()
+        except queue.Empty:
+            client = self._retry(self._create_client)
+            self.logger.debug("Created Shotgun client for thread %s", threading.current_thread().name)
+
+        lease = _ClientLease(client, generation)
+        weakref.finalize(lease, self._checkin_client, client, generation)
+        self._leases.add(lease)
+        return lease
+
+    def _checkin_client(self, client, generation):
+        """Return a released client to the pool, or close it if the pool is full or it is stale."""
+        if generation == self._generation and self._connected:
+            try:
+                self._client_pool.put_nowait(client)
+                return
+            except queue.Full:
+                pass
+        try:
+            client.close()
+        except Exception as e:
+            self.logger.debug("Error closing Shotgun client: %s", e)
+
+    def _close_worker_clients(self):
+        """Close pooled and leased worker clients, leases taken before this call become stale."""
+        self._generation += 1
+        for lease in list(self._leases):
+            lease.client.close()
+        while True:
+            try:
+                self._client_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    @property
+    def io_executor(self):
+        """
+        Shared long-lived executor for uploads/downloads.
+
+        Its threads keep their leased clients, so fanning work out doesn't build a
+        new Shotgun client per call the way a per-call ThreadPoolExecutor would.
+
+        Returns:
+            ThreadPoolExecutor with IO_WORKERS threads
+        """
+        return _io_executor
+
+    @property
+    def session(self):
+        """
+        Shared keep-alive requests.Session used by the Shotgun clients and direct HTTP calls.
+
+        Returns:
+            requests.Session, or None if not connected
+        """
+        return self._session
+
+    def _create_session(self):
+        """Build a requests.Session with a pooled HTTPS adapter."""
+        session = requests.Session()
+        # Session headers are merged into every request, including shotgun_api3's own headers
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        session.mount("https://", HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=Retry(
+                total=self._max_retries,
+                backoff_factor=0.3,
+                status_forcelist=RETRY_STATUS_CODES
+            )
+        ))
+        return session
+
+    def _create_http2_client(self):
+        """
+        Build the optional HTTP/2 httpx.Client.
+
+        Returns:
+            httpx.Client, or None if SG_HTTP2 is off or httpx[http2] is not installed
+        """
+        if not HTTP2_ENABLED:
+            return None
+
+        try:
+            import httpx
+            return httpx.Client(
+                http2=True,
+                headers={"Accept-Encoding": ACCEPT_ENCODING},
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=HTTP2_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP2_MAX_KEEPALIVE
+                )
+            )
+        except ImportError as e:
+            self.logger.warning("SG_HTTP2 is set but httpx[http2] is unavailable, using HTTP/1.1: %s", e)
+            return None
+
+    def _create_client(self):
+        """Build a new Shotgun client from the stored credentials."""
+        # Imported on first connect, processes that never connect skip the import cost
+        import shotgun_api3 as sg
+
+        url, script_name, api_key = self._credentials
+        # connect=False defers the server info request to the first API call, so it
+        # goes through the pooled, time-limited transport set up below
+        client = sg.shotgun.Shotgun(
+            base_url=url,
+            script_name=script_name,
+            api_key=api_key,
+            connect=False
+        )
+        # Bounds a hung socket instead of blocking the pipeline indefinitely
+        client.config.timeout_secs = self._timeout
+        if self._use_session(client):
+            # The pooled transport already retries (urllib3 Retry) and _retry wraps reads,
+            # shotgun_api3's own RPC retries on top would multiply the attempts
+            client.config.max_rpc_attempts = 1
+
+        # Optional: orjson parses large find() responses several times faster than json
+        try:
+            import orjson
+            client._json_loads = orjson.loads
+        except ImportError:
+            pass
+        return client
+
+    def _acquire_client(self, url):
+        """Get the shared main client for url from the registry, creating it on first use."""
+        with _CLIENTS_LOCK:
+            entry = _CLIENTS.get(url)
+            if entry is not None:
+                entry[1] += 1
+                return entry[0]
+
+        # Built and probed outside the lock so a slow or retrying site doesn't block
+        # _release_client and connects to other sites
+        client = self._retry(self._create_client)
+        try:
+            # Clients are built with connect=False, fetch server info now so an
+            # unreachable site still fails connect() instead of the first query
+            self._retry(getattr, client, "server_caps")
+        except Exception:
+            client.close()
+            raise
+
+        with _CLIENTS_LOCK:
+            entry = _CLIENTS.get(url)
+            if entry is None:
+                entry = _CLIENTS[url] = [client, 0]
+            entry[1] += 1
+            shared = entry[0]
+
+        # Another caller registered a client for url while this one was being built
+        if shared is not client:
+            client.close()
+        return shared
+
+    def _release_client(self, url):
+        """Drop one reference to the registry client for url, closing it with the last one."""
+        with _CLIENTS_LOCK:
+            entry = _CLIENTS.get(url)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                entry[0].close()
+                del _CLIENTS[url]
+
+    @staticmethod
+    def uses_stock_transport(client):
+        """
+        Whether a Shotgun client has to keep shotgun_api3's own httplib2 transport.
+
+        The shared session only knows the default proxy-less, certifi-verified setup,
+        so a proxy, a custom CA bundle (ca_certs / SHOTGUN_API_CACERTS) or disabled
+        SSL validation would be silently dropped by it.
+
+        Args:
+            client: shotgun_api3 Shotgun client
+
+        Returns:
+            bool: True if the client's requests must not go through the shared session
+        """
+        import shotgun_api3 as sg
+
+        config = client.config
+        return bool(
+            config.proxy_server
+            or getattr(config, "ca_certs", None)
+            or os.environ.get("SHOTGUN_API_CACERTS")
+            or getattr(config, "no_ssl_validation", False)
+            or getattr(sg.shotgun, "NO_SSL_VALIDATION", False)
+        )
+
+    def _use_session(self, client):
+        """
+        Route a Shotgun client's API requests through the shared requests.Session.
+
+        shotgun_api3 opens its own httplib2 connection per client; replacing its
+        _http_request keeps every client on the same keep-alive pool. When the HTTP/2
+        client is available it is used instead. Clients with a proxy, custom CA certs
+        or SSL validation turned off keep the stock transport (see uses_stock_transport).
+
+        Returns:
+            bool: True if the client's transport was replaced
+        """
+        if self.uses_stock_transport(client):
+            return False
+
+        config = client.config
+
+        http2_client = self._http2_client
+        if http2_client is not None:
+            def http2_request(verb, path, body, headers):
+                response = http2_client.request(
+                    verb,
+                    f"{config.scheme}://{config.server}{path}",
+                    content=body,
+                    headers=headers,
+                    timeout=config.timeout_secs
+                )
+                return (
+                    (response.status_code, response.reason_phrase),
+                    {key.lower(): value for key, value in response.headers.items()},
+                    response.content
+                )
+
+            client._http_request = http2_request
+            return True
+
+        session = self._session
+
+        def http_request(verb, path, body, headers):
+            response = session.request(
+                verb,
+                f"{config.scheme}://{config.server}{path}",
+                data=body,
+                headers=headers,
+                timeout=config.timeout_secs
+            )
+            # Same ((status, reason), lowercase headers, body) tuple shotgun_api3 expects
+            return (
+                (response.status_code, response.reason),
+                {key.lower(): value for key, value in response.headers.items()},
+                response.content
+            )
+
+        client._http_request = http_request
+        return True
+
+    def connect(self, timeout=DEFAULT_TIMEOUT, max_retries=DEFAULT_MAX_RETRIES):
         """
         Establish persistent connection to Shotgun.
         Should be called once at application startup.
 
+        Args:
+            timeout: Per-request timeout in seconds
+            max_retries: Retries for failed connections and 502/503/504 responses
+
         Returns:
             bool: True if connection successful, False otherwise
 
@@ -30,52 +559,108 @@ class ShotgridInstance():
             ConnectionError: If unable to connect to Shotgun
         """
         # If already connected, return success
-        if self._is_connected and self.instance:
+        if self._connected:
             self.logger.info("Already connected to Shotgun")
             return True
 
-        # Get credentials from environment
-        url = os.getenv('SG_URL')
-        script_name = os.getenv('SG_SCRIPT_NAME')
-        api_key = os.getenv('SG_SCRIPT_KEY')
+        with self._connect_lock:
+            # Another thread may have connected while we waited for the lock
+            if self._connected:
+                return True
+            self._timeout = timeout
+            self._max_retries = max_retries
+            return self._connect()
+
+    async def connect_async(self, timeout=DEFAULT_TIMEOUT, max_retries=DEFAULT_MAX_RETRIES):
+        """
+        Connect without blocking the event loop.
+
+        The blocking connect() (client construction, TLS handshake) runs in the loop's
+        default executor; concurrent callers on the same loop wait on that loop's
+        asyncio.Lock, callers on different loops are serialized by _connect_lock.
+
+        Returns:
+            bool: True if connection successful
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = self._async_locks[loop] = asyncio.Lock()
+
+        async with lock:
+            if self._connected:
+                return True
+            return await loop.run_in_executor(None, self.connect, timeout, max_retries)
 
-        # Validate credentials exist
-        if not (url and script_name and api_key):
+    def _connect(self):
+        """Create the Shotgun client, caller holds _connect_lock."""
+        # Get credentials from environment, validated once per env snapshot
+        try:
+            url, script_name, api_key = _sg_credentials()
+        except ValueError:
             self.logger.error("Missing Shotgun credentials in environment variables")
-            raise ValueError(
-                "Missing required environment variables: SG_URL, SG_SCRIPT_NAME, SG_SCRIPT_KEY"
-            )
+            raise
 
         # Attempt connection
         try:
-            self.instance = sg.shotgun.Shotgun(
-                base_url=url,
-                script_name=script_name,
-                api_key=api_key
-            )
-            self._is_connected = True
-            self.logger.info(f"Successfully connected to Shotgun: {url}")
+            self._credentials = (url, script_name, api_key)
+            self._session = self._create_session()
+            self._http2_client = self._create_http2_client()
+            self._instance = self._acquire_client(url)
+            self._owner_thread = threading.get_ident()
+            self._connected = True
+            self.logger.info("Successfully connected to Shotgun: %s", url)
+
+            # Fill metadata caches in the background so the first user query doesn't pay for them
+            threading.Thread(target=self._warmup, name="sg_warmup", daemon=True).start()
             return True
 
-        except Exception as e:
-            self.logger.error(f"Failed to connect to Shotgun: {e}")
-            raise ConnectionError(f"Unable to connect to {url}: {str(e)}")
+        except _connection_errors() as e:
+            self._reset_failed_connect()
+            self.logger.error("Failed to connect to Shotgun: %s", e)
+            raise ConnectionError(f"Unable to connect to {url}") from e
+        except Exception:
+            self._reset_failed_connect()
+            raise
+
+    def _reset_failed_connect(self):
+        """Close the transports a failed _connect already opened and clear its state."""
+        if self._session:
+            self._session.close()
+            self._session = None
+        if self._http2_client:
+            self._http2_client.close()
+            self._http2_client = None
+        self._instance = None
+        self._owner_thread = None
+        self._credentials = None
 
     def disconnect(self):
         """
         Close Shotgun connection.
         Should be called once at application shutdown.
         """
-        if self.instance and self._is_connected:
-            try:
-                self.instance.close()
-                self._is_connected = False
-                self.logger.info("Shotgun connection closed")
-            except Exception as e:
-                self.logger.error(f"Error closing connection: {e}")
-        else:
-            self.logger.warning("No active connection to close")
+        with self._connect_lock:
+            if self._connected:
+                # Flip first so other threads stop using the clients being closed
+                self._connected = False
+                try:
+                    self._release_client(self._credentials[0])
+                    self._close_worker_clients()
+                    if self._session:
+                        self._session.close()
+                        self._session = None
+                    if self._http2_client:
+                        self._http2_client.close()
+                        self._http2_client = None
+                    self._clear_metadata_caches()
+                    self.logger.info("Shotgun connection closed")
+                except _connection_errors() as e:
+                    self.logger.error("Error closing connection: %s", e)
+            else:
+                self.logger.warning("No active connection to close")
 
+    @property
     def is_connected(self):
         """
         Check if connection is active.
@@ -83,7 +668,7 @@ class ShotgridInstance():
         Returns:
             bool: True if connected, False otherwise
         """
-        return self._is_connected and self.instance is not None
+        return self._connected
 
     def ensure_connected(self):
         """
@@ -92,105 +677,247 @@ class ShotgridInstance():
         Raises:
             ConnectionError: If not connected and unable to connect
         """
-        if not self.is_connected():
+        # Called before every manager operation: read the flag directly, no method call
+        if not self._connected:
             raise ConnectionError(
                 "Not connected to Shotgun. Call connect() first."
             )
 
+    def batch(self, requests_list):
+        """
+        Run several create/update/delete requests in one HTTP call.
 
-if __name__ == "__main__":
-    import requests
-    import shutil
+        Args:
+            requests_list: Shotgun batch request dicts
+                           ({'request_type': 'update', 'entity_type': ..., 'entity_id': ..., 'data': {...}}, ...)
 
-    setup_logging()
-    logger = logging.getLogger(__name__)
+        Returns:
+            list: Results in the same order as requests_list
+        """
+        self.ensure_connected()
+        return self.instance.batch(requests_list)
 
-    # Test persistent connection pattern
-    sg_instance = ShotgridInstance()
+    def find_many(self, queries):
+        """
+        Run independent find queries concurrently.
 
-    # Connect once at startup
-    sg_instance.connect()
+        Each worker thread uses its own Shotgun client (see instance), so the wall
+        time is roughly the slowest query instead of the sum of all of them.
 
-    # Verify connection
-    print(f"Connected: {sg_instance.is_connected()}")
+        Args:
+            queries: List of (entity_type, filters, fields) tuples
 
-    # getting schemas
-    # schemas = sg_instance.instance.schema_field_read(entity_type="Step")
-    # print(schemas)
+        Returns:
+            list: One result list per query, in the same order as queries
+        """
+        self.ensure_connected()
 
-    # getting entities - no connect/disconnect needed
-    entities = sg_instance.instance.find(
-        entity_type="Step",
-        filters=[],
-        fields= [
-            'code', 'description', 'color', 'short_name', 'department', 'list_order', 'entity_type',
-            'cached_display_name', 'updated_by', 'created_by', 'created_at', 'updated_at', 'id'
+        futures = [
+            _executor.submit(self._find, entity_type, filters, fields)
+            for entity_type, filters, fields in queries
         ]
-    )
-    print(f"Found {len(entities)} assets")
-    print(entities)
-
-    # update entities
-    # data = {'sg_asset_type': 'Character'}
-    # updated_entity = sg_instance.instance.update(entity_type="Asset", entity_id=1445, data=data)
-    # print(updated_entity)
-
-    # Disconnect once at shutdown
-    sg_instance.disconnect()
-
-
-    # data = [
-    #     {'type': 'Step', 'id': 2, 'code': 'Online', 'description': None, 'color': '213,213,213', 'short_name': 'ONL', 'department': None, 'list_order': 5, 'entity_type': 'Shot', 'cached_display_name': 'Online', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 54, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 6, 'code': 'FX', 'description': None, 'color': '253,188,0', 'short_name': 'FX', 'department': None, 'list_order': 11, 'entity_type': 'Shot', 'cached_display_name': 'FX', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 7, 'code': 'Light', 'description': None, 'color': '25,118,27', 'short_name': 'LGT', 'department': None, 'list_order': 12, 'entity_type': 'Shot', 'cached_display_name': 'Light', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 8, 'code': 'Comp', 'description': None, 'color': '0,126,174', 'short_name': 'CMP', 'department': None, 'list_order': 13, 'entity_type': 'Shot', 'cached_display_name': 'Comp', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 13, 'code': 'Art', 'description': None, 'color': '253,94,99', 'short_name': 'ART', 'department': None, 'list_order': 7, 'entity_type': 'Asset', 'cached_display_name': 'Art', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 14, 'code': 'Model', 'description': None, 'color': '254,173,146', 'short_name': 'MDL', 'department': None, 'list_order': 8, 'entity_type': 'Asset', 'cached_display_name': 'Model', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 15, 'code': 'Rig', 'description': None, 'color': '161,236,154', 'short_name': 'RIG', 'department': None, 'list_order': 9, 'entity_type': 'Asset', 'cached_display_name': 'Rig', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 16, 'code': 'Texture', 'description': None, 'color': '253,254,152', 'short_name': 'TXT', 'department': None, 'list_order': 10, 'entity_type': 'Asset', 'cached_display_name': 'Texture', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2009, 12, 11, 23, 40, 56, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 32, 'code': 'Animation', 'description': None, 'color': '192,97,253', 'short_name': 'ANM', 'department': None, 'list_order': 12, 'entity_type': 'Asset', 'cached_display_name': 'Animation', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2012, 11, 26, 16, 22, 44, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 35, 'code': 'Layout', 'description': None, 'color': '183,0,188', 'short_name': 'LAY', 'department': None, 'list_order': 8, 'entity_type': 'Shot', 'cached_display_name': 'Layout', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2015, 11, 2, 14, 55, 45, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 106, 'code': 'Animation', 'description': None, 'color': '252,47,140', 'short_name': 'ANM', 'department': None, 'list_order': 9, 'entity_type': 'Shot', 'cached_display_name': 'Animation', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': None, 'created_at': datetime.datetime(2015, 12, 17, 10, 28, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 119, 'code': 'Concept', 'description': None, 'color': '252,47,140', 'short_name': 'CPT', 'department': None, 'list_order': 1, 'entity_type': 'Level', 'cached_display_name': 'Concept', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 57, 59, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 28, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 120, 'code': 'Level Design', 'description': None, 'color': '254,125,179', 'short_name': 'LD', 'department': None, 'list_order': 2, 'entity_type': 'Level', 'cached_display_name': 'Level Design', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 18, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 30, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 121, 'code': 'Modeling', 'description': None, 'color': '255,181,76', 'short_name': 'MDL', 'department': None, 'list_order': 3, 'entity_type': 'Level', 'cached_display_name': 'Modeling', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 25, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 32, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 122, 'code': 'Level Art', 'description': None, 'color': '254,205,138', 'short_name': 'LA', 'department': None, 'list_order': 4, 'entity_type': 'Level', 'cached_display_name': 'Level Art', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 34, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 34, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 123, 'code': 'Lighting', 'description': None, 'color': '253,252,100', 'short_name': 'LTG', 'department': None, 'list_order': 5, 'entity_type': 'Level', 'cached_display_name': 'Lighting', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 41, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 36, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 124, 'code': 'Animation', 'description': None, 'color': '253,254,152', 'short_name': 'ANM', 'department': None, 'list_order': 6, 'entity_type': 'Level', 'cached_display_name': 'Animation', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 49, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 41, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 125, 'code': 'FX', 'description': None, 'color': '103,226,102', 'short_name': 'FX', 'department': None, 'list_order': 7, 'entity_type': 'Level', 'cached_display_name': 'FX', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 58, 55, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 43, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 126, 'code': 'Gameplay', 'description': None, 'color': '161,236,154', 'short_name': 'GPL', 'department': None, 'list_order': 8, 'entity_type': 'Level', 'cached_display_name': 'Gameplay', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 59, 1, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 46, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 127, 'code': 'QA', 'description': None, 'color': '50,149,253', 'short_name': 'QA', 'department': None, 'list_order': 9, 'entity_type': 'Level', 'cached_display_name': 'QA', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 59, 7, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 47, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 128, 'code': 'Integration', 'description': None, 'color': '129,183,255', 'short_name': 'INT', 'department': None, 'list_order': 10, 'entity_type': 'Level', 'cached_display_name': 'Integration', 'updated_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2016, 12, 12, 17, 59, 17, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2018, 12, 3, 20, 26, 50, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 129, 'code': 'Design', 'description': None, 'color': '254,125,179', 'short_name': 'DSN', 'department': None, 'list_order': 6, 'entity_type': 'Asset', 'cached_display_name': 'Design', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 3, 21, 11, 19, 48, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 131, 'code': 'Visualization', 'description': None, 'color': '2,149,216', 'short_name': 'VIZ', 'department': None, 'list_order': 14, 'entity_type': 'Asset', 'cached_display_name': 'Visualization', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 3, 21, 11, 20, 50, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 132, 'code': 'Class-A', 'description': None, 'color': '222,182,255', 'short_name': 'CSA', 'department': None, 'list_order': 15, 'entity_type': 'Asset', 'cached_display_name': 'Class-A', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 3, 21, 11, 21, 26, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 133, 'code': 'Tracking', 'description': None, 'color': '50,149,253', 'short_name': 'TRK', 'department': None, 'list_order': 6, 'entity_type': 'Shot', 'cached_display_name': 'Tracking', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 4, 26, 12, 33, 29, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 134, 'code': 'Roto', 'description': None, 'color': '156,1,255', 'short_name': 'RTO', 'department': None, 'list_order': 7, 'entity_type': 'Shot', 'cached_display_name': 'Roto', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 4, 26, 12, 41, 4, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 136, 'code': 'Character FX', 'description': None, 'color': '253,94,99', 'short_name': 'CFX', 'department': None, 'list_order': 10, 'entity_type': 'Shot', 'cached_display_name': 'Character FX', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 4, 26, 18, 20, 11, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 137, 'code': 'Character FX', 'description': None, 'color': '129,183,255', 'short_name': 'CFX', 'department': None, 'list_order': 11, 'entity_type': 'Asset', 'cached_display_name': 'Character FX', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 24, 'name': 'ShotGrid Support', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2019, 10, 11, 14, 0, 51, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 142, 'code': 'Surfacing', 'description': None, 'color': None, 'short_name': 'SF', 'department': None, 'list_order': 5, 'entity_type': 'Asset', 'cached_display_name': 'Surfacing', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 3, 21, 2, 1, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 175, 'code': 'Previs', 'description': None, 'color': '94,0,0', 'short_name': 'PRE', 'department': None, 'list_order': 4, 'entity_type': 'Shot', 'cached_display_name': 'Previs', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 0, 12, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 176, 'code': 'LightRig', 'description': None, 'color': '184,178,4', 'short_name': 'LGR', 'department': None, 'list_order': 4, 'entity_type': 'Asset', 'cached_display_name': 'LightRig', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 1, 56, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 177, 'code': 'Delivery', 'description': None, 'color': '161,236,154', 'short_name': 'DEL', 'department': None, 'list_order': 3, 'entity_type': 'Shot', 'cached_display_name': 'Delivery', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 3, 16, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 178, 'code': 'Assembly', 'description': None, 'color': '253,252,100', 'short_name': 'ASB', 'department': None, 'list_order': 2, 'entity_type': 'Shot', 'cached_display_name': 'Assembly', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 4, 31, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 179, 'code': 'Render', 'description': None, 'color': '0,230,254', 'short_name': 'RDR', 'department': None, 'list_order': 1, 'entity_type': 'Shot', 'cached_display_name': 'Render', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 5, 21, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 180, 'code': 'Render', 'description': None, 'color': '0,230,254', 'short_name': 'RDR', 'department': None, 'list_order': 3, 'entity_type': 'Asset', 'cached_display_name': 'Render', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 7, 9, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}, 
-    #     {'type': 'Step', 'id': 181, 'code': 'Comp', 'description': None, 'color': '255,218,137', 'short_name': 'COMP', 'department': None, 'list_order': 2, 'entity_type': 'Asset', 'cached_display_name': 'Comp', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 7, 35, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)},
-    #     {'type': 'Step', 'id': 182, 'code': 'Delivery', 'description': None, 'color': '161,236,154', 'short_name': 'DEL', 'department': None, 'list_order': 1, 'entity_type': 'Asset', 'cached_display_name': 'Delivery', 'updated_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_by': {'id': 88, 'name': 'kukari animation', 'type': 'HumanUser'}, 'created_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>), 'updated_at': datetime.datetime(2025, 11, 17, 13, 7, 57, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7da0156144d0>)}
-    # ]
-
-    # shots = [
-    #     {'type': 'Shot', 'id': 1207, 'code': 'sq010_010', 
-    #      'tasks': [
-    #          {'id': 6059, 'name': '00_Animatic', 'type': 'Task'}, 
-    #          {'id': 6058, 'name': '01_Layout', 'type': 'Task'}, 
-    #          {'id': 6060, 'name': '02_Animacion', 'type': 'Task'}, 
-    #          {'id': 6062, 'name': '03_Assembly', 'type': 'Task'}, 
-    #          {'id': 6063, 'name': '04_Lighting', 'type': 'Task'}, 
-    #          {'id': 6065, 'name': '05_Render', 'type': 'Task'}, 
-    #          {'id': 6061, 'name': '06_Comp', 'type': 'Task'}, 
-    #          {'id': 6066, 'name': '07_Fx', 'type': 'Task'}, 
-    #          {'id': 6064, 'name': '08_Output', 'type': 'Task'}
-    #     ], 'assets': [], 'sg_versions': [], 'sg_published_files': []}]
+        return [future.result() for future in futures]
+
+    # ===================================================================
+    # Cached metadata - read-only within a session, cleared on disconnect
+    # ===================================================================
+
+    @functools.lru_cache(maxsize=256)
+    def schema_field_read_cached(self, entity_type, field_name=None):
+        """
+        Cached schema_field_read for an entity type, or a single field of it.
+
+        Args:
+            entity_type: Shotgun entity type, e.g. "Asset"
+            field_name: Optional field to read instead of the whole entity schema
+
+        Returns:
+            dict: Field name -> field schema
+        """
+        self.ensure_connected()
+        return self.instance.schema_field_read(entity_type, field_name)
+
+    @functools.lru_cache(maxsize=256)
+    def find_project_cached(self, project_id):
+        """
+        Cached Project lookup by id.
+
+        Args:
+            project_id: Shotgun project id
+
+        Returns:
+            dict: Project dictionary, or None if not found
+        """
+        self.ensure_connected()
+        return self.instance.find_one("Project", [["id", "is", project_id]], ["id", "name"])
+
+    def get_entity(self, entity_type, entity_id, fields):
+        """
+        Get an entity by id, reusing a copy another caller still holds.
+
+        Args:
+            entity_type: Shotgun entity type
+            entity_id: Entity id
+            fields: Fields to retrieve
+
+        Returns:
+            dict: Entity dictionary, or None if not found
+        """
+        key = (entity_type, entity_id)
+        cached = self._entity_cache.get(key)
+        if cached is not None and all(field in cached for field in fields):
+            return cached
+        return self._load_entity(key, fields, cached)
+
+    def _load_entity(self, key, fields, cached=None):
+        """Fetch an entity and store it in the weak cache, merged with any cached fields."""
+        self.ensure_connected()
+        entity_type, entity_id = key
+        entity = self.instance.find_one(entity_type, [["id", "is", entity_id]], fields)
+        if not entity:
+            return None
+
+        result = _CachedEntity(cached or {})
+        result.update(entity)
+        self._entity_cache[key] = result
+        return result
+
+    def get_steps(self, fields=DEFAULT_STEP_FIELDS):
+        """
+        Pipeline steps, cached for STEP_CACHE_TTL seconds.
+
+        A cached query made with a superset of fields is reused by trimming the rows locally.
+
+        Args:
+            fields: Step fields to retrieve
+
+        Returns:
+            list: Step dictionaries
+        """
+        requested = frozenset(fields)
+        cached = self._step_cache
+        if cached is not None:
+            fetched_at, cached_fields, steps = cached
+            if time.monotonic() - fetched_at < STEP_CACHE_TTL and requested <= cached_fields:
+                if requested == cached_fields:
+                    return steps
+                keep = requested | {"type", "id"}
+                return [{key: value for key, value in step.items() if key in keep} for step in steps]
+
+        self.ensure_connected()
+        steps = self.instance.find("Step", [], list(fields))
+        self._step_cache = (time.monotonic(), requested, steps)
+        return steps
+
+    @property
+    def projects(self):
+        """
+        Prefetched projects.
+
+        Returns:
+            dict: Project id -> {"type", "id", "name"}, empty until warmup has run
+        """
+        return self._projects
+
+    @property
+    def users(self):
+        """
+        Prefetched users, lets callers validate a HumanUser id without a request.
+
+        Returns:
+            dict: HumanUser id -> {"type", "id", "name"}, empty until warmup has run
+        """
+        return self._users
+
+    def _warmup(self):
+        """
+        Preload schemas, steps, projects, users and the default project (SG_DEFAULT_PROJECT_ID)
+        into the caches.
+        Runs on its own thread and client, failures only cost the cache miss later.
+        """
+        try:
+            self.schema_field_read_cached("Asset")
+            self.schema_field_read_cached("Shot")
+            self.get_steps()
+            self._projects = {project["id"]: project for project in self.instance.find("Project", [], ["id", "name"])}
+            self._users = {user["id"]: user for user in self.instance.find("HumanUser", [], ["id", "name"])}
+
+            project_id = int(os.getenv("SG_DEFAULT_PROJECT_ID", "0"))
+            if project_id:
+                self.find_project_cached(project_id)
+
+            self.logger.debug("Shotgun metadata caches warmed up")
+        except Exception as e:
+            self.logger.debug("Shotgun cache warmup skipped: %s", e)
+
+    def _clear_metadata_caches(self):
+        """Drop cached schema, project, user and entity lookups."""
+        ShotgridInstance.schema_field_read_cached.cache_clear()
+        ShotgridInstance.find_project_cached.cache_clear()
+        self._entity_cache.clear()
+        self._step_cache = None
+        self._projects = {}
+        self._users = {}
+
+    def batched_find(self, requests_list):
+        """
+        Run several reads as one concurrent round of requests.
+
+        Shotgun batch() only accepts create/update/delete, so reads are fanned out
+        over find_many instead; wall time is about one round-trip rather than N.
+
+        Args:
+            requests_list: List of {"entity_type": ..., "filters": [...], "fields": [...]} dicts
+
+        Returns:
+            list: One result list per request, in the same order
+        """
+        return self.find_many([
+            (request["entity_type"], request.get("filters", []), request.get("fields", ["id"]))
+            for request in requests_list
+        ])
+
+    def _find(self, entity_type, filters, fields):
+        """find() on the calling thread's client, used by find_many workers."""
+        return self._retry(self.instance.find, entity_type, filters, fields)
+
+    def _retry(self, fn, *args, max_retries=RETRY_ATTEMPTS, base=RETRY_BASE_DELAY,
+               cap=RETRY_MAX_DELAY, jitter=RETRY_JITTER, **kwargs):
+        """
+        Call fn, retrying recoverable network errors with exponential backoff and jitter.
+
+        Only used for client construction and reads; creates are never retried so a
+        request that reached the server isn't applied twice. Anything else (bad
+        credentials, ValueError, programming errors) is raised immediately.
+
+        Returns:
+            fn's return value
+        """
+        import shotgun_api3 as sg
+        recoverable = (
+            socket.timeout, ConnectionResetError, http.client.RemoteDisconnected,
+            requests.ConnectionError, requests.Timeout, sg.ProtocolError
+        )
+
+        for attempt in range(max_retries + 1):
+            try:
+                return fn(*args, **kwargs)
+            except recoverable as e:
+                if attempt == max_retries:
+                    raise
+                delay = random.uniform(1, 1 + jitter) * min(cap, base * 2 ** attempt)
+                self.logger.warning("Shotgun request failed (%s), retry %s/%s in %.1fs", e, attempt + 1, max_retries, delay)
+                time.sleep(delay)
+
+
 
+def get():
+    """
+    Process-wide ShotgridInstance, connected on first use.
 
+    Returns:
+        ShotgridInstance: The shared, connected instance to pass to managers
+    """
+    instance = ShotgridInstance()
+    instance.connect()
+    return instance
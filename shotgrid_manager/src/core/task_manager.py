@@ -1,71 +1,228 @@
 from core.base_manager import BaseManager
-from typing import List
+from typing import Callable, Iterator, List, Optional, Tuple
 from utils.logger import setup_logging
+from utils import sg_cache
+import hashlib
+import json
 import logging
 
+# Rows per find() page when streaming project-wide task lists
+TASK_PAGE_SIZE = 500
+
+
+def _query_key(entity:str, filters:list, fields:List[str])->str:
+    """Short stable key for a query, filters hold nested dicts so they can't be hashed directly."""
+    payload = json.dumps([entity, filters, fields], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
 
 class TaskManager(BaseManager):
     entity = "Task"
-    entity_fields = [
-        "id", "code", "content", "project", "due_date", "sg_priority_1", "entity", 
-        "sg_status_list", "task_assignees", "sg_versions", "step", "name"
-    ]
-
-    def get_task(self, task_id:int)->dict:
-        return self.get_entity(
-            filters=[["id", "is", task_id]],
-            fields= self.entity_fields
-        )
+    # get_tasks_from_* default to minimal_fields, multi-entity fields (assignees, versions)
+    # are server side joins, pass fields=TaskManager.full_fields when they are needed
+    minimal_fields = ["id", "code", "content", "sg_status_list", "entity", "project"]
+    full_fields = minimal_fields + ["due_date", "sg_priority_1", "task_assignees", "sg_versions", "step", "name"]
+    entity_fields = full_fields
+
+    def _cached_query(self, cache:sg_cache.TTLCache, fetch:Callable, filters:list, fields:List[str]):
+        """
+        Return a cached read result, or run fetch(filters=..., fields=...) and cache it.
 
-    def get_tasks_from_user(self, user_id:int)->List[dict]:
+        Args:
+            cache: TTLCache the result is stored in
+            fetch: get_entity or get_entities
+            filters: Shotgun filter list
+            fields: Fields to retrieve
+
+        Returns:
+            fetch's result, shared with other callers of the same query
+        """
+        key = _query_key(self.entity, filters, fields)
+        result = cache.get(key)
+        if result is None:
+            result = fetch(filters=filters, fields=fields)
+            if result is not None:
+                cache[key] = result
+        return result
+
+    def get_task(self, task_id:int, fields:Optional[List[str]]=None)->dict:
+        # Single rows share sg_cache.TASK_CACHE with PathBuilder and the services;
+        # Task writes through any manager evict it (BaseManager.update_entity/batch)
+        return sg_cache.get_task(self.manager, task_id, fields or self.entity_fields)
+
+    def get_tasks_from_user(self, user_id:int, fields:Optional[List[str]]=None)->List[dict]:
 
         task_list = self.get_entities( 
             filters=[["task_assignees", "is", {"type": "HumanUser", "id":user_id}]], 
-            fields= self.entity_fields
+            fields=fields or self.minimal_fields
         )
         return task_list
 
-    def get_tasks_from_shot(self, shot_id:int)->List[dict]:
-        task_list = self.get_entities( 
-            filters=[["entity", "is", {"type": "Shot", "id":shot_id}]], 
-            fields= self.entity_fields
+    def get_tasks_for(self, entity_type:str, entity_ids:List[int], fields:Optional[List[str]]=None)->List[dict]:
+        """
+        Get the tasks of many entities of one type with a single 'in' query.
+
+        Args:
+            entity_type: Linked entity type, e.g. "Shot" or "Asset"
+            entity_ids: Ids of the linked entities
+            fields: Fields to retrieve, defaults to minimal_fields
+
+        Returns:
+            Flat list of task dictionaries, use task['entity'] to group them
+        """
+        if not entity_ids:
+            return []
+
+        task_list = self._cached_query(
+            sg_cache.TASK_QUERIES, self.get_entities,
+            filters=[["entity", "in", [{"type": entity_type, "id": entity_id} for entity_id in entity_ids]]],
+            fields=fields or self.minimal_fields
         )
         return task_list
 
-    def get_tasks_from_asset(self, asset_id:int)->List[dict]:
-        task_list = self.get_entities(
-            filters=[["entity", "is", {"type": "Asset", "id": asset_id}]],
-            fields=self.entity_fields
+    def get_tasks_from_shot(self, shot_id:int, fields:Optional[List[str]]=None)->List[dict]:
+        return self.get_tasks_for("Shot", [shot_id], fields=fields)
+
+    def get_tasks_from_asset(self, asset_id:int, fields:Optional[List[str]]=None)->List[dict]:
+        return self.get_tasks_for("Asset", [asset_id], fields=fields)
+
+    def get_tasks_from_project(self, project_id:int, fields:Optional[List[str]]=None)->List[dict]:
+        task_list = self._cached_query(
+            sg_cache.PROJECT_QUERIES, lambda filters, fields: list(self.iter_entities(filters, fields, page_size=TASK_PAGE_SIZE)),
+            filters=[["project", "is", {"type":"Project", "id":project_id}]],
+            fields=fields or self.minimal_fields
         )
         return task_list
 
-    def get_tasks_from_project(self, project_id:int):
-        task_list = self.get_entities(
+    def iter_tasks_from_project(self, project_id:int, fields:Optional[List[str]]=None,
+                                page_size:int=TASK_PAGE_SIZE)->Iterator[dict]:
+        """
+        Stream a project's tasks page by page instead of holding the whole list.
+
+        Args:
+            project_id: Shotgun project id
+            fields: Fields to retrieve, defaults to minimal_fields
+            page_size: Rows per request
+
+        Returns:
+            Iterator over task dictionaries, not cached
+        """
+        return self.iter_entities(
             filters=[["project", "is", {"type":"Project", "id":project_id}]],
-            fields=self.entity_fields
+            fields=fields or self.minimal_fields,
+            page_size=page_size
         )
-        return task_list
+
+    def get_tasks_for_entities(self, entities:List[dict], fields:Optional[List[str]]=None)->List[List[dict]]:
+        """
+        Get the tasks of several entities (Shots, Assets, ...) with one query per entity type.
+
+        Each type goes through get_tasks_for's 'in' query and the rows are grouped
+        back by task['entity'].
+
+        Args:
+            entities: Entity dicts with type and id
+            fields: Fields to retrieve, defaults to minimal_fields
+
+        Returns:
+            One task list per entity, in the same order as entities
+        """
+        fields = fields or self.minimal_fields
+        if "entity" not in fields:
+            fields = fields + ["entity"]
+
+        ids_by_type = {}
+        for entity in entities:
+            ids_by_type.setdefault(entity["type"], []).append(entity["id"])
+
+        tasks_by_entity = {}
+        for entity_type, entity_ids in ids_by_type.items():
+            for task in self.get_tasks_for(entity_type, list(dict.fromkeys(entity_ids)), fields=fields) or []:
+                linked = task.get("entity")
+                if linked:
+                    tasks_by_entity.setdefault((linked["type"], linked["id"]), []).append(task)
+
+        return [list(tasks_by_entity.get((entity["type"], entity["id"]), [])) for entity in entities]
 
     def update_status(self, task_id, new_status)->dict:
         data = {"sg_status_list": new_status}
-        return self.update_entity(task_id=task_id, new_data=data)
+        return self.update_entity(entity_id=task_id, data=data)
     
     def update_assignee(self, task_id:int, user_id:int)->dict:
         if (task_id < 0 and user_id < 0) or task_id == user_id:
             self.logger.error("invalid data , please provide a valid task and a valid user.")
             return 
 
-        task = self.get_task(task_id=task_id)
-        current_assignees = task.get("task_assignees", [])
-        if current_assignees:
-            for human_user in current_assignees:
-                if human_user.get("id", -1) == user_id:
-                    logger.info(f"User already assigned, nothing to do.")
-                    return task
-        current_assignees.append({'type': 'HumanUser', 'id': user_id})
-            
-        data= {"task_assignees": current_assignees}
-        return self.update_entity(entity_id=task_id, data=data)
+        # users is the connect-time snapshot (empty until warmup has run), a user missing
+        # from it may have been created since, so ask the server before refusing
+        users = self.manager.users
+        if users and user_id not in users:
+            human_user = self.manager.get_entity("HumanUser", user_id, ["id", "name"])
+            if not human_user:
+                self.logger.error("Unknown HumanUser id %s, task %s not updated.", user_id, task_id)
+                return
+            users[user_id] = {"type": "HumanUser", "id": user_id, "name": human_user.get("name")}
+
+        user = {'type': 'HumanUser', 'id': user_id}
+        # Let the server check the assignment instead of reading the whole assignee list
+        task = self.get_entity(
+            filters=[["id", "is", task_id], ["task_assignees", "is", user]],
+            fields=["id"]
+        )
+        if task:
+            self.logger.info("User already assigned, nothing to do.")
+            return task
+
+        # 'add' appends server side, existing assignees don't need to be sent back
+        data= {"task_assignees": [user]}
+        return self.update_entity(
+            entity_id=task_id, data=data, multi_entity_update_modes={"task_assignees": "add"}
+        )
+
+    def update_assignees_bulk(self, pairs:List[Tuple[int, int]])->List[dict]:
+        """
+        Add assignees to many tasks with one read and one batch() update.
+
+        Args:
+            pairs: (task_id, user_id) tuples, a task may appear more than once
+
+        Returns:
+            Updated task dictionaries, tasks where every user was already assigned are skipped
+        """
+        users_by_task = {}
+        for task_id, user_id in pairs:
+            users_by_task.setdefault(task_id, []).append(user_id)
+        if not users_by_task:
+            return []
+
+        tasks = self.get_entities(
+            filters=[["id", "in", list(users_by_task)]],
+            fields=["task_assignees"]
+        )
+
+        requests = []
+        for task in tasks:
+            assignees = [
+                {'type': 'HumanUser', 'id': human_user['id']}
+                for human_user in task.get("task_assignees") or []
+            ]
+            assigned_ids = {human_user['id'] for human_user in assignees}
+            new_ids = [
+                user_id for user_id in dict.fromkeys(users_by_task[task['id']])
+                if user_id not in assigned_ids
+            ]
+            if not new_ids:
+                continue
+
+            assignees.extend({'type': 'HumanUser', 'id': user_id} for user_id in new_ids)
+            requests.append({
+                "request_type": "update",
+                "entity_type": self.entity,
+                "entity_id": task['id'],
+                "data": {"task_assignees": assignees}
+            })
+
+        return self.batch(requests)
 
 
 if __name__ == "__main__":
@@ -73,16 +230,11 @@ if __name__ == "__main__":
     setup_logging()
     logger = logging.getLogger(__name__)
 
-    flow = ShotgridInstance()
-    flow.connect()
-    task_manager = TaskManager(shotgun_instance=flow)
-    
-    tasks = task_manager.get_tasks_from_asset(asset_id=1511)
-    # for task in tasks:
-    #     updated_task = task_manager.update_assignee(task_id=task.get('id', -1), user_id=121)
-    # # logger.info(f"data= {data}")
-    logger.info(f"tasks = {tasks}")
-    flow.disconnect()
+    with TaskManager(shotgun_instance=ShotgridInstance()) as task_manager:
+        tasks = task_manager.get_tasks_from_asset(asset_id=1511)
+        # updated_tasks = task_manager.update_assignees_bulk([(task['id'], 121) for task in tasks])
+        # # logger.info(f"data= {data}")
+        logger.info(f"tasks = {tasks}")
 
 
     # task_manager.update_entity(
@@ -1,16 +1,46 @@
 from core.base_manager import BaseManager
 from utils.logger import setup_logging
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
 import logging
 
 
+@dataclass(frozen=True)
+class UserRow():
+    """
+    Compact, slotted HumanUser row; projects are kept as a tuple of ids instead of link dicts.
+    """
+    __slots__ = ("id", "name", "firstname", "lastname", "status", "project_ids")
+
+    id: int
+    name: str
+    firstname: str
+    lastname: str
+    status: str
+    project_ids: Tuple[int, ...]
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "UserRow":
+        return cls(
+            id=row["id"],
+            name=row.get("name") or "",
+            firstname=row.get("firstname") or "",
+            lastname=row.get("lastname") or "",
+            status=row.get("sg_status_list") or "",
+            project_ids=tuple(project["id"] for project in row.get("projects") or []),
+        )
+
 
 class UserManager(BaseManager):
     entity = "HumanUser"
-    entity_fields = [
-            "projects", "id", 
+    # the projects link list is a server side join, only full_fields requests it
+    minimal_fields = [
+            "id",
             "sg_status_list", # ['act', 'dis']
             "name", "lastname", "firstname",
         ]
+    full_fields = minimal_fields + ["projects"]
+    entity_fields = minimal_fields
 
     def create_user(self, last_name:str, first_name:str, status:str="dis")->dict:
         """
@@ -26,16 +56,88 @@ class UserManager(BaseManager):
         }
         
         return self.create_entity(data = user_data)
+
+    def create_users(self, users:List[dict], status:str="dis")->List[dict]:
+        """
+        Create several users with one batch() call instead of a create_user call each.
+
+        Args:
+            users: dicts with 'last_name' and 'first_name', and optionally 'status'
+            status: default status for users that don't set one
+        """
+        return self.batch_create([
+            {
+                'sg_status_list': user.get('status', status),
+                'firstname': user['first_name'],
+                'lastname': user['last_name']
+            }
+            for user in users
+        ])
     
+    def get_user_with_projects(self, user_id:int)-> dict:
+        """
+        gets a single user with full_fields, including the linked projects.
+        """
+        return self.get_entity(
+            filters=[["id", "is", user_id]],
+            fields=self.full_fields
+        )
+
     def get_all_users(self, custom_filters:list=None, custom_fields:list=None)-> list:
         """
-        gets all users dictionaries from the shot gun instance, if a list of fields is provided it will be used 
+        gets all users dictionaries from the shot gun instance, if a list of fields is provided it will be used.
+        defaults to minimal_fields (no projects), pass UserManager.full_fields to include them.
         """ 
-        return self.get_entities(
+        return list(self.iter_users(custom_filters=custom_filters, custom_fields=custom_fields))
+
+    def iter_users(self, custom_filters:list=None, custom_fields:list=None)-> Iterator[dict]:
+        """
+        same as get_all_users but streams the users page by page instead of building the list.
+        """
+        return self.iter_entities(
             filters=custom_filters or [],
             fields=custom_fields or self.entity_fields
         )
 
+    def get_active_users(self, project_id:int=None, custom_fields:list=None)-> list:
+        """
+        gets active ('act') users, optionally only the ones on project_id.
+        both predicates are sent as filters so ShotGrid narrows the rows before sending them.
+        """
+        filters = [["sg_status_list", "is", "act"]]
+        if project_id is not None:
+            filters.append(["projects", "is", {"type": "Project", "id": project_id}])
+        return self.get_entities(
+            filters=filters,
+            fields=custom_fields or self.entity_fields
+        )
+
+    def get_users_page(self, page:int=1, page_size:int=50, custom_filters:list=None, custom_fields:list=None)-> list:
+        """
+        gets one page of users (ordered by id), for UIs that render a page at a time.
+        filters are applied server side before paging.
+        """
+        return self.get_entities(
+            filters=custom_filters or [],
+            fields=custom_fields or self.entity_fields,
+            order=[{'field_name': 'id', 'direction': 'asc'}],
+            limit=page_size,
+            page=page
+        )
+
+    def get_user_rows(self, custom_filters:list=None, with_projects:bool=False)-> List[UserRow]:
+        """
+        gets users as UserRow objects, converted while streaming so the list of dicts is never built.
+        """
+        fields = self.full_fields if with_projects else self.minimal_fields
+        return [UserRow.from_dict(row) for row in self.iter_users(custom_filters=custom_filters, custom_fields=fields)]
+
+    async def aget_all_users(self, custom_filters:list=None, custom_fields:list=None)-> list:
+        """
+        get_all_users without blocking the event loop.
+        """
+        return await self._run_async(self.get_all_users, custom_filters=custom_filters, custom_fields=custom_fields)
+
 
 if __name__ == "__main__":
     """
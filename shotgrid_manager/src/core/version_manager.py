@@ -0,0 +1,384 @@
+from core.base_manager import BaseManager
+from core.shotgrid_instance import ShotgridInstance
+from utils.logger import setup_logging
+from utils import sg_cache
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+import time
+
+# Version reads are reused for this long (seconds), writes through this manager evict them
+VERSION_CACHE_TTL = 30
+VERSION_CACHE_SIZE = 1024
+
+# UI version lists (task id -> versions) are reused for this long (seconds)
+TASK_VERSIONS_UI_TTL = 300
+
+
+@dataclass(frozen=True)
+class VersionRow():
+    """
+    Compact, slotted Version row, about a third of the memory of the find() dict.
+    """
+    __slots__ = ("id", "code", "client_code", "sg_task_id", "status")
+
+    id: int
+    code: str
+    client_code: str
+    sg_task_id: Optional[int]
+    status: str
+
+    # Fields needed by from_dict
+    fields = ["id", "code", "client_code", "sg_task", "sg_status_list"]
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "VersionRow":
+        task = row.get("sg_task")
+        return cls(
+            id=row["id"],
+            code=row.get("code") or "",
+            client_code=row.get("client_code") or "",
+            sg_task_id=task["id"] if task else None,
+            status=row.get("sg_status_list") or "",
+        )
+
+
+class VersionManager(BaseManager):
+    entity = "Version"
+    entity_fields = ['tasks', 'id', 'sg_task', 'published_files', 'code', 'sg_status_list']
+    # get_versions_from_task defaults to minimal_fields, pass full_fields for the linked entities
+    minimal_fields = ["id"]
+    full_fields = ["id", "code", "client_code","entity", "created_at", "project", "tasks", "published_files"]
+
+    # Shared head of every "versions of a task" filter
+    _TASK_FILTER_TEMPLATE = ("sg_task", "is")
+
+    # Task id -> versions as shown by the dependencies dialog, shared by every manager
+    # so reopening the dialog in the same session skips the query. Cleared by invalidate,
+    # versions_cache.pop(task_id) drops a single task
+    versions_cache = sg_cache.TTLCache(maxsize=VERSION_CACHE_SIZE, ttl=TASK_VERSIONS_UI_TTL)
+
+    def __init__(self, shotgun_instance: ShotgridInstance):
+        super().__init__(shotgun_instance)
+        # Per manager, so the cache lives and dies with the manager using the connection
+        self._version_cache = sg_cache.TTLCache(maxsize=VERSION_CACHE_SIZE, ttl=VERSION_CACHE_TTL)
+        self._task_versions_cache = sg_cache.TTLCache(maxsize=VERSION_CACHE_SIZE, ttl=VERSION_CACHE_TTL)
+        # (fetched_at, frozenset(fields), task id -> versions) from the last prefetch_for_project,
+        # ignored after VERSION_CACHE_TTL like the other version reads
+        self._project_index = None
+
+    def _task_filter(self, task_id:int)->list:
+        return [*self._TASK_FILTER_TEMPLATE, {"type": "Task", "id":task_id}]
+
+    def invalidate(self, version_id:Optional[int]=None):
+        """
+        Evict cached reads after a write.
+        Drops version_id (or every version if None) and all cached task version lists.
+        """
+        if version_id is None:
+            self._version_cache.clear()
+        else:
+            self._version_cache.pop(version_id, None)
+        self._task_versions_cache.clear()
+        self.versions_cache.clear()
+        self._project_index = None
+
+    # Writes evict once they are done (finally, so a failed write that may still have
+    # reached the server evicts too): a read from another thread while the write is in
+    # flight would otherwise refill the caches with the pre-write rows
+
+    def create_entity(self, data:dict)->Optional[dict]:
+        try:
+            return super().create_entity(data=data)
+        finally:
+            self.invalidate()
+
+    def update_entity(self, entity_id:int, data:dict, multi_entity_update_modes:Optional[dict]=None)->dict:
+        try:
+            return super().update_entity(
+                entity_id=entity_id, data=data, multi_entity_update_modes=multi_entity_update_modes
+            )
+        finally:
+            self.invalidate(entity_id)
+
+    def batch(self, requests:List[dict])->List:
+        try:
+            return super().batch(requests)
+        finally:
+            self.invalidate()
+
+    def get_version(self, version_id:int)->dict:
+        version = self._version_cache.get(version_id)
+        if version is None:
+            version = self.get_entity(
+                filters=[["id", "is", version_id]],
+                fields=self.entity_fields
+            )
+            if version is not None:
+                self._version_cache[version_id] = version
+        return version
+
+    async def aget_version(self, version_id:int)->dict:
+        """get_version without blocking the event loop."""
+        return await self._run_async(self.get_version, version_id)
+
+    async def aget_versions_from_task(self, task_id:int, fields:Optional[List[str]]=None)->List[dict]:
+        """get_versions_from_task without blocking the event loop."""
+        return await self._run_async(self.get_versions_from_task, task_id, fields=fields)
+
+    def get_versions_from_task(self, task_id:int, fields:Optional[List[str]]=None)-> List[dict]:
+        """
+        returns a list of version dictionaries, newest first.
+        fields defaults to minimal_fields, pass VersionManager.full_fields for code, links, etc.
+        """
+        fields = fields or self.minimal_fields
+
+        # Served from a recent project prefetch when it has this task and every requested field
+        index = self._project_index
+        if index is not None:
+            fetched_at, index_fields, versions_by_task = index
+            if (time.monotonic() - fetched_at < VERSION_CACHE_TTL
+                    and task_id in versions_by_task and index_fields.issuperset(fields)):
+                return versions_by_task[task_id]
+
+        key = (task_id, tuple(fields))
+        version_list = self._task_versions_cache.get(key)
+        if version_list is None:
+            version_list = self.get_entities(
+                filters=[self._task_filter(task_id)],
+                fields=fields,
+                order=[{'field_name':'created_at', 'direction':'desc'}]
+            )
+            self._task_versions_cache[key] = version_list
+
+        return version_list
+
+    def prefetch_for_project(self, project_id:int, fields:Optional[List[str]]=None)->Dict[int, List[dict]]:
+        """
+        Load every version of a project once and index it by task, so following
+        get_versions_from_task calls are dict lookups instead of requests.
+        The index expires after VERSION_CACHE_TTL and is dropped on any write through this manager.
+
+        Returns:
+            task id -> versions newest first
+        """
+        fields = list(fields or self.full_fields)
+        if "sg_task" not in fields:
+            fields.append("sg_task")
+
+        index = {}
+        for version in self.iter_entities(
+            filters=[["project", "is", {"type": "Project", "id": project_id}]],
+            fields=fields,
+            order=[{'field_name':'created_at', 'direction':'desc'}, {'field_name':'id', 'direction':'desc'}]
+        ):
+            task = version.get("sg_task")
+            if task:
+                index.setdefault(task["id"], []).append(version)
+
+        self._project_index = (time.monotonic(), frozenset(fields), index)
+        self.logger.debug(f"Indexed versions of {len(index)} tasks for project {project_id}")
+        return index
+
+    def get_versions_for_tasks(self, task_ids:List[int], fields:Optional[List[str]]=None)->Dict[int, List[dict]]:
+        """
+        Versions of many tasks with a single 'in' query instead of one get_versions_from_task call each.
+
+        Returns:
+            task id -> versions newest first, every task_id is present (empty list if it has none)
+        """
+        fields = list(fields or self.minimal_fields)
+        if "sg_task" not in fields:
+            fields.append("sg_task")
+
+        versions_by_task = {task_id: [] for task_id in task_ids}
+        if not task_ids:
+            return versions_by_task
+
+        versions = self.get_entities(
+            filters=[["sg_task", "in", [{"type": "Task", "id": task_id} for task_id in task_ids]]],
+            fields=fields,
+            order=[{'field_name':'created_at', 'direction':'desc'}]
+        )
+        for version in versions:
+            versions_by_task[version["sg_task"]["id"]].append(version)
+        return versions_by_task
+
+    def get_version_with_siblings(self, version_id:int, task_id:int)->Tuple[Optional[dict], List[dict]]:
+        """
+        Get a version and every version on the same task with one query.
+
+        Returns:
+            (version, versions) where versions is newest first and includes version,
+            version is None if it isn't on task_id
+        """
+        versions = self.get_entities(
+            filters=[self._task_filter(task_id)],
+            fields=self.entity_fields,
+            order=[{'field_name':'created_at', 'direction':'desc'}]
+        )
+        version = next((row for row in versions if row["id"] == version_id), None)
+        return version, versions
+
+    def iter_versions_from_task(self, task_id:int, fields:Optional[List[str]]=None)->Iterator[dict]:
+        """
+        Stream a task's versions page by page, newest first. Not cached.
+        Use count_versions_for_task when only the number of versions is needed.
+        """
+        return self.iter_entities(
+            filters=[self._task_filter(task_id)],
+            fields=fields or self.minimal_fields,
+            order=[{'field_name':'created_at', 'direction':'desc'}, {'field_name':'id', 'direction':'desc'}]
+        )
+
+    def get_version_rows_from_task(self, task_id:int)->List[VersionRow]:
+        """
+        A task's versions as VersionRow objects, newest first. Rows are converted while
+        streaming so the list of dicts is never built.
+        """
+        return [VersionRow.from_dict(row) for row in self.iter_versions_from_task(task_id, fields=VersionRow.fields)]
+
+    def count_versions_for_task(self, task_id:int)->int:
+        """
+        Number of versions on a task, counted server side without downloading the rows.
+        """
+        summary = self.summarize(
+            filters=[self._task_filter(task_id)],
+            summary_fields=[{"field": "id", "type": "count"}]
+        )
+        return (summary.get("summaries") or {}).get("id") or 0
+    
+    def build_version_data(self, task_id:int, name:str, version_code:str, project_id:int, **extra_fields)->dict:
+        return {
+            "project":{"type":"Project", "id":project_id},
+            "sg_task":{"type":"Task", "id":task_id},
+            "code":name,
+            "client_code":version_code,
+            **extra_fields
+        }
+
+    def create_version(self, task_id:int, name:str, version_code:str, project_id:int, **extra_fields)->dict:
+        """
+        extra_fields (e.g. description) are sent in the same create request
+        """
+        version = self.create_entity(
+            data=self.build_version_data(
+                task_id=task_id,
+                name=name,
+                version_code=version_code,
+                project_id=project_id,
+                **extra_fields
+            )
+        )
+        return version
+    
+    def update_version(self, version_id, data_to_update)->dict:
+
+        updated_version = self.update_entity(
+                entity_id=version_id,
+                data=data_to_update
+            )
+        return updated_version
+
+    def update_versions(self, updates:List[Tuple[int, dict]])->List[dict]:
+        """
+        Update several versions with one batch() call, updates are (version_id, data_to_update) pairs.
+        """
+        return self.batch_update(updates)
+    
+    def get_latest_version_number_for_task(self, task_id:int)->Optional[int]:
+        """
+        Highest version number on a task, the numeric maximum of its client_code values.
+        Codes are only padded to 3 digits (v999 < v1000 as numbers, not as text), so the
+        maximum is taken here rather than with a server side text summary. This pages
+        through the client_code of every version on the task, on every publish.
+
+        Returns None if the task has no versions with a vNNN client_code
+        """
+        latest = None
+        for version in self.iter_entities(filters=[self._task_filter(task_id)], fields=["client_code"]):
+            digits = str(version.get("client_code") or "").lstrip("vV")
+            if digits.isdigit():
+                number = int(digits)
+                if latest is None or number > latest:
+                    latest = number
+        return latest
+
+    def get_next_version_number_for_task(self, task_id:int)->int:
+        """
+        Determine next version number for task.
+
+        Returns the highest client_code (vNNN) + 1, so deleted versions don't cause a
+        number to be reused; falls back to version count + 1 (1 if no versions exist)
+        when no code can be read. Errors from the count query propagate, guessing v001
+        would publish a duplicate version
+        """
+        try:
+            latest = self.get_latest_version_number_for_task(task_id=task_id)
+            if latest is not None:
+                return latest + 1
+        except Exception as e:
+            self.logger.warning(f"Error reading version codes for task {task_id}, using the version count: {e}")
+
+        return self.count_versions_for_task(task_id=task_id) + 1
+    
+
+if __name__ == "__main__":
+    from core.shotgrid_instance import ShotgridInstance
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    flow = ShotgridInstance()
+    flow.connect()
+    version_manager = VersionManager(shotgun_instance=flow)
+    # _data = {}
+    # data = version_manager.update_version(version_id=6990, data_to_update=_data)
+    version = version_manager.get_version(version_id=7033)
+    # data = version_manager.update_version(version_id=6990, data=_data)
+    flow.disconnect()
+    logger.info(f"data= {version}")
+
+    # data= [
+        #     {
+        #         'type': 'Version', 'id': 7031, 'code': 'generic_prop_1_002_Modeling_v004', 'client_code': 'v004', 'entity': None, 
+        #         # 'created_at': datetime.datetime(2025, 11, 28, 15, 10, 18, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7970e29fee50>), 
+        #         'project': {'id': 124, 'name': 'SandBox', 'type': 'Project'}, 
+        #         'tasks': [], 
+        #         'published_files': [{'id': 77, 'name': 'CianLu_V02.v004', 'type': 'PublishedFile'}]
+        #     }, 
+        #     {
+        #         'type': 'Version', 'id': 7030, 'code': '002_Modeling', 'client_code': 'v001', 'entity': None, 
+        #         # 'created_at': datetime.datetime(2025, 11, 28, 15, 1, 12, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7970e29fee50>), 
+        #         'project': {'id': 124, 'name': 'SandBox', 'type': 'Project'}, 
+        #         'tasks': [], 
+        #         'published_files': [{'id': 76, 'name': 'CianLu_V02.v001', 'type': 'PublishedFile'}]
+        #     }, 
+        #     {
+        #         'type': 'Version', 'id': 7029, 'code': '002_Modeling', 'client_code': 'v001', 'entity': None, 
+        #         # 'created_at': datetime.datetime(2025, 11, 28, 15, 0, 47, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7970e29fee50>), 
+        #         'project': {'id': 124, 'name': 'SandBox', 'type': 'Project'}, 
+        #         'tasks': [], 
+        #         'published_files': [{'id': 75, 'name': 'CianLu_V02.v001', 'type': 'PublishedFile'}]
+        #     }, 
+        #     {
+        #         'type': 'Version', 'id': 7028, 'code': '002_Modeling', 'client_code': 'v001', 'entity': None, 
+        #         # 'created_at': datetime.datetime(2025, 11, 28, 14, 50, 46, tzinfo=<shotgun_api3.lib.sgtimezone.LocalTimezone object at 0x7970e29fee50>), 
+        #         'project': {'id': 124, 'name': 'SandBox', 'type': 'Project'}, 'tasks': [], 
+        #         'published_files': [{'id': 74, 'name': 'CianLu_V02.v001', 'type': 'PublishedFile'}]
+        #     }
+        # ]
+    # data= {
+    #         'type': 'Version', 'id': 7031, 'tasks': [], 'sg_task': {'id': 5947, 'name': '002_Modeling', 'type': 'Task'}, 
+    #         'published_files': [{'id': 77, 'name': 'CianLu_V02.v004', 'type': 'PublishedFile'}], 
+    #         'code': 'generic_prop_1_002_Modeling_v004', 'sg_status_list': 'rev'
+    #     }
+    # data= {
+    #         'type': 'Version', 'id': 7033, 'tasks': [], 'sg_task': {'id': 5947, 'name': '002_Modeling', 'type': 'Task'}, 
+    #         'published_files': [
+    #                 {'id': 83, 'name': 'CianLu_Body_Color.1001.v006', 'type': 'PublishedFile'}, 
+    #                 {'id': 84, 'name': 'CianLu_Body_Color.1002.v006', 'type': 'PublishedFile'}, 
+    #                 {'id': 85, 'name': 'CianLu_Body_Color.1003.v006', 'type': 'PublishedFile'}, 
+    #                 {'id': 82, 'name': 'CianLu_Body_Color.1005.v006', 'type': 'PublishedFile'}
+    #             ], 
+    #         'code': 'generic_prop_1__002_Modeling__v006', 'sg_status_list': 'rev'
+    #     }
\ No newline at end of file
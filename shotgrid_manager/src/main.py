@@ -8,13 +8,14 @@ Initializes the PySide6 application and main window.
 import sys
 import os
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
 import logging
 
-from ui.main_window import MainWindow
+# PySide6 and the UI are imported inside setup_application()/main(), so importing
+# this module (e.g. to run check_environment) doesn't pay the Qt import cost
 from utils.logger import setup_logging
 
+logger = logging.getLogger(__name__)
+
 
 def check_environment():
     """
@@ -23,10 +24,9 @@ def check_environment():
     Returns:
         bool: True if environment is configured, False otherwise
     """
-    logger = logging.getLogger(__name__)
-
-    required_vars = ['SG_URL', 'SG_SCRIPT_NAME', 'SG_SCRIPT_KEY', 'KUKARI_USER_ID']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    env = os.environ
+    required_vars = ('SG_URL', 'SG_SCRIPT_NAME', 'SG_SCRIPT_KEY', 'KUKARI_USER_ID')
+    missing_vars = [var for var in required_vars if not env.get(var)]
 
     if missing_vars:
         logger.warning(f"Missing environment variables: {', '.join(missing_vars)}")
@@ -36,15 +36,15 @@ def check_environment():
         return False
 
     # Validate KUKARI_USER_ID is a number
-    user_id = os.getenv('KUKARI_USER_ID')
+    user_id = env['KUKARI_USER_ID']
     try:
         int(user_id)
-    except (ValueError, TypeError):
+    except ValueError:
         logger.error(f"KUKARI_USER_ID must be a number, got: {user_id}")
         return False
 
     # Check WORK_AREA (optional but recommended)
-    if not os.getenv('WORK_AREA'):
+    if not env.get('WORK_AREA'):
         logger.warning("WORK_AREA environment variable not set")
         logger.warning("Path building functionality may be limited")
 
@@ -58,6 +58,9 @@ def setup_application():
     Returns:
         QApplication: Configured application instance
     """
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+
     # Create application
     app = QApplication(sys.argv)
 
@@ -85,7 +88,6 @@ def main():
     """
     # Setup logging first
     setup_logging()
-    logger = logging.getLogger(__name__)
 
     logger.info("=" * 60)
     logger.info("Shotgrid Manager - Starting Application")
@@ -103,6 +105,8 @@ def main():
     logger.info(" Application initialized")
 
     try:
+        from ui.main_window import MainWindow
+
         # Create and show main window
         window = MainWindow()
         window.show()
@@ -11,20 +11,161 @@ Displays task dependencies in a tree view with:
 
 import logging
 import os
+import threading
+from concurrent.futures import as_completed
 from typing import Dict, List, Optional
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTreeWidget, QTreeWidgetItem, QGroupBox, QMessageBox,
-    QProgressDialog, QApplication, QMenu
+    QProgressDialog, QMenu
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QAction, QIcon
 
-from core.version_manger import VersionManager
+from core.version_manager import VersionManager
 from core.dependency_resolver import EXCLUDED_VERSION_STATUSES
 from core.download_service import DownloadService
 
+# Max concurrent ShotGrid version queries started by expanding tree items
+MAX_VERSION_FETCH_THREADS = 4
+
+# Fields shown for each version in the tree
+VERSION_TREE_FIELDS = ['id', 'code', 'created_at', 'published_files', 'sg_status_list', 'sg_task']
+
+
+class VersionFetchSignals(QObject):
+    """Signals for VersionFetchWorker (QRunnable is not a QObject)."""
+    finished = Signal(int, list)  # task_id, versions
+    failed = Signal(int, str)  # task_id, error message
+
+
+class VersionFetchWorker(QRunnable):
+    """
+    Loads all versions of a task on a thread pool thread.
+
+    Results are delivered through signals, queued to the receiver's (UI) thread.
+    VersionManager calls are safe here since ShotgridInstance gives each thread
+    its own Shotgun client.
+    """
+
+    def __init__(self, task_id: int, version_manager: VersionManager, filters: list, fields: list, order: list):
+        super().__init__()
+        self.task_id = task_id
+        self.version_manager = version_manager
+        self.filters = filters
+        self.fields = fields
+        self.order = order
+        self.signals = VersionFetchSignals()
+
+    def run(self):
+        try:
+            versions = self.version_manager.get_entities(
+                filters=self.filters,
+                fields=self.fields,
+                order=self.order
+            )
+        except Exception as e:
+            self.signals.failed.emit(self.task_id, str(e))
+            return
+        self.signals.finished.emit(self.task_id, versions)
+
+
+class DownloadSignals(QObject):
+    """Signals for DownloadWorker."""
+    progress = Signal(int, int, str)  # current, total, file name or version code
+    finished = Signal(list)  # downloaded file paths
+    failed = Signal(str)  # error message
+
+
+class DownloadWorker(QRunnable):
+    """
+    Downloads one or more versions on a thread pool thread.
+
+    With per_file_progress a single version is downloaded and progress is reported
+    per file, otherwise progress is reported per version and the versions download
+    concurrently on the ShotgridInstance io_executor. Setting cancel_event stops before the next file and
+    reports the download as failed.
+    """
+
+    def __init__(
+        self,
+        download_service: DownloadService,
+        versions_data: List[Dict],
+        cancel_event: threading.Event,
+        per_file_progress: bool = False
+    ):
+        super().__init__()
+        self.download_service = download_service
+        self.versions_data = versions_data
+        self.cancel_event = cancel_event
+        self.per_file_progress = per_file_progress
+        self.signals = DownloadSignals()
+
+    def run(self):
+        try:
+            if self.per_file_progress:
+                downloaded_files = self._download_single()
+            else:
+                downloaded_files = self._download_multiple()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        if self.cancel_event.is_set():
+            self.signals.failed.emit("Download canceled by user")
+            return
+        self.signals.finished.emit(downloaded_files)
+
+    def _download_single(self) -> List[str]:
+        version_info = self.versions_data[0]
+        return self.download_service.download_version(
+            version=version_info['version'],
+            task_data=version_info['task'],
+            progress_callback=self.signals.progress.emit,
+            cancel_event=self.cancel_event
+        )
+
+    def _download_multiple(self) -> List[str]:
+        logger = logging.getLogger(__name__)
+        all_downloaded_files = []
+        total_versions = len(self.versions_data)
+
+        # DownloadService is safe to share across threads: it keeps no per-download
+        # state and ShotgridInstance gives each worker thread its own Shotgun client
+        executor = self.download_service.shotgrid_instance.io_executor
+        futures = {
+            executor.submit(
+                self.download_service.download_version,
+                version=version_info['version'],
+                task_data=version_info['task'],
+                progress_callback=None,  # No individual progress for batch
+                cancel_event=self.cancel_event
+            ): version_info['version']
+            for version_info in self.versions_data
+        }
+
+        try:
+            for i, future in enumerate(as_completed(futures)):
+                version_code = futures[future].get('code', 'Unknown')
+
+                if self.cancel_event.is_set():
+                    break
+
+                try:
+                    all_downloaded_files.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Failed to download version {version_code}: {e}")
+                    # Continue with other versions
+
+                self.signals.progress.emit(i + 1, total_versions, version_code)
+        finally:
+            # Drop queued downloads (on cancel or error), running ones stop before their next file
+            for pending in futures:
+                pending.cancel()
+
+        return all_downloaded_files
+
 
 class DependenciesDialog(QDialog):
     """
@@ -77,6 +218,14 @@ class DependenciesDialog(QDialog):
         # Track expanded dependencies (task_id -> versions list)
         self.expanded_versions = {}
 
+        # Version queries in flight (task_id -> (task_item, placeholder_item))
+        self._pending_versions = {}
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(MAX_VERSION_FETCH_THREADS)
+
+        # Running download: progress dialog, cancel event and message details
+        self._download = None
+
         self._setup_ui()
         self._populate_tree()
         self._apply_style()
@@ -180,41 +329,53 @@ class DependenciesDialog(QDialog):
             no_deps_item.setForeground(0, Qt.gray)
             return
 
-        # Group dependencies by source
-        upstream_deps = [d for d in self.dependencies if d.get('source') == 'upstream_task']
-        asset_deps = [d for d in self.dependencies if d.get('source') == 'asset_dependency']
-
-        # Add upstream tasks
-        if upstream_deps:
-            upstream_root = QTreeWidgetItem(
-                self.tree,
-                [f"Upstream Tasks ({len(upstream_deps)})", "", ""]
-            )
-            upstream_root.setExpanded(True)
-            upstream_root.setData(0, Qt.UserRole, {'type': 'category'})
-
-            for dep in upstream_deps:
-                self._add_dependency_item(upstream_root, dep)
-
-        # Add asset dependencies
-        if asset_deps:
-            asset_root = QTreeWidgetItem(
-                self.tree,
-                [f"Asset Dependencies ({len(asset_deps)})", "", ""]
-            )
-            asset_root.setExpanded(True)
-            asset_root.setData(0, Qt.UserRole, {'type': 'category'})
-
-            for dep in asset_deps:
-                self._add_dependency_item(asset_root, dep)
-
-    def _add_dependency_item(self, parent: QTreeWidgetItem, dep: Dict):
+        # Group dependencies by source in one pass, unknown sources are dropped
+        buckets = {'upstream_task': [], 'asset_dependency': []}
+        for dep in self.dependencies:
+            bucket = buckets.get(dep.get('source'))
+            if bucket is not None:
+                bucket.append(dep)
+        upstream_deps, asset_deps = buckets['upstream_task'], buckets['asset_dependency']
+
+        # Build the tree detached, then insert each level with a single call
+        # and repaint once at the end
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            roots = []
+
+            # Add upstream tasks
+            if upstream_deps:
+                upstream_root = QTreeWidgetItem([f"Upstream Tasks ({len(upstream_deps)})", "", ""])
+                upstream_root.setData(0, Qt.UserRole, {'type': 'category'})
+                upstream_root.addChildren([self._create_dependency_item(dep) for dep in upstream_deps])
+                roots.append(upstream_root)
+
+            # Add asset dependencies
+            if asset_deps:
+                asset_root = QTreeWidgetItem([f"Asset Dependencies ({len(asset_deps)})", "", ""])
+                asset_root.setData(0, Qt.UserRole, {'type': 'category'})
+                asset_root.addChildren([self._create_dependency_item(dep) for dep in asset_deps])
+                roots.append(asset_root)
+
+            self.tree.addTopLevelItems(roots)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+
+        # Open the categories in one pass, setExpanded per item relayouts the view each time.
+        # Depth 0 keeps task rows collapsed so their versions still load on demand
+        self.tree.expandToDepth(0)
+
+    def _create_dependency_item(self, dep: Dict) -> QTreeWidgetItem:
         """
-        Add a dependency item to the tree.
+        Create a dependency item, the caller adds it to the tree.
 
         Args:
-            parent: Parent tree item
             dep: Dependency dictionary
+
+        Returns:
+            Task tree item
         """
         # Get task info
         task = dep.get('task', {})
@@ -236,13 +397,25 @@ class DependenciesDialog(QDialog):
             actual = dep.get('actual_step', '')
             label += f" [Using {actual} - {preferred} not available]"
 
-        # Create task item
-        task_item = QTreeWidgetItem(parent, [label, "", task_content])
+        # Create task item, its children are built on first expansion
+        task_item = QTreeWidgetItem([label, "", task_content])
         task_item.setData(0, Qt.UserRole, {
             'type': 'task',
             'task_id': task_id,
             'dependency': dep
         })
+        task_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        return task_item
+
+    def _add_dependency_children(self, task_item: QTreeWidgetItem, dep: Dict):
+        """
+        Add warning, latest version and "load all versions" placeholder under a task item.
+
+        Args:
+            task_item: Task tree item
+            dep: Dependency dictionary
+        """
+        task_id = dep.get('task', {}).get('id', -1)
 
         # Add warning if present
         warning = dep.get('version_warning')
@@ -254,7 +427,7 @@ class DependenciesDialog(QDialog):
         # Add latest version if available
         version = dep.get('version')
         if version:
-            self._add_version_item(task_item, version, is_latest=True)
+            task_item.addChild(self._create_version_item(version, is_latest=True))
 
         # Add placeholder for "Load All Versions"
         load_item = QTreeWidgetItem(
@@ -267,19 +440,20 @@ class DependenciesDialog(QDialog):
             'task_id': task_id
         })
 
-    def _add_version_item(
+    def _create_version_item(
         self,
-        parent: QTreeWidgetItem,
         version: Dict,
         is_latest: bool = False
-    ):
+    ) -> QTreeWidgetItem:
         """
-        Add a version item to the tree.
+        Create a version item, the caller adds it to the tree.
 
         Args:
-            parent: Parent tree item
             version: Version dictionary
             is_latest: Whether this is the latest version
+
+        Returns:
+            Version tree item
         """
         version_id = version.get('id', -1)
         version_code = version.get('code', 'Unknown')
@@ -299,22 +473,31 @@ class DependenciesDialog(QDialog):
         if is_latest:
             label += " ⭐ (Latest)"
 
-        # Create version item
-        version_item = QTreeWidgetItem(
-            parent,
-            [label, version_status, created_str]
-        )
+        # Create version item, its files are built on first expansion
+        version_item = QTreeWidgetItem([label, version_status, created_str])
         version_item.setData(0, Qt.UserRole, {
             'type': 'version',
             'version_id': version_id,
             'version': version
         })
+        version_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        return version_item
 
+    def _add_version_children(self, version_item: QTreeWidgetItem, version: Dict):
+        """
+        Add published file items under a version item.
+
+        Args:
+            version_item: Version tree item
+            version: Version dictionary
+        """
         # Add published files
         published_files = version.get('published_files', [])
         if published_files:
-            for pub_file in published_files:
-                self._add_published_file_item(version_item, pub_file)
+            version_item.addChildren([
+                self._create_published_file_item(pub_file)
+                for pub_file in published_files
+            ])
         else:
             no_files_item = QTreeWidgetItem(
                 version_item,
@@ -323,25 +506,28 @@ class DependenciesDialog(QDialog):
             no_files_item.setForeground(0, Qt.gray)
             no_files_item.setData(0, Qt.UserRole, {'type': 'no_files'})
 
-    def _add_published_file_item(self, parent: QTreeWidgetItem, pub_file: Dict):
+    def _create_published_file_item(self, pub_file: Dict) -> QTreeWidgetItem:
         """
-        Add a published file item to the tree.
+        Create a published file item, the caller adds it under its version.
 
         Args:
-            parent: Parent tree item (version)
             pub_file: Published file dictionary
+
+        Returns:
+            File tree item
         """
         file_id = pub_file.get('id', -1)
         file_name = pub_file.get('name', 'Unknown File')
         file_type = pub_file.get('type', 'PublishedFile')
 
         # Create file item
-        file_item = QTreeWidgetItem(parent, [f"📄 {file_name}", "File", ""])
+        file_item = QTreeWidgetItem([f"📄 {file_name}", "File", ""])
         file_item.setData(0, Qt.UserRole, {
             'type': 'published_file',
             'file_id': file_id,
             'file': pub_file
         })
+        return file_item
 
     # ========================================================================
     # Version Expansion
@@ -350,7 +536,10 @@ class DependenciesDialog(QDialog):
     @Slot(QTreeWidgetItem)
     def _on_item_expanded(self, item: QTreeWidgetItem):
         """
-        Handle item expansion - load all versions if needed.
+        Handle item expansion - build children and load all versions if needed.
+
+        Task and version children are only created the first time the item is
+        expanded, so opening the dialog doesn't build rows for every file.
 
         Args:
             item: Expanded tree item
@@ -361,12 +550,19 @@ class DependenciesDialog(QDialog):
 
         item_type = data.get('type')
 
+        if item_type == 'version':
+            if item.childCount() == 0:
+                self._add_version_children(item, data.get('version', {}))
+
         # If this is a task item, check if we need to load versions
-        if item_type == 'task':
+        elif item_type == 'task':
+            if item.childCount() == 0:
+                self._add_dependency_children(item, data.get('dependency', {}))
+
             task_id = data.get('task_id', -1)
 
-            # Check if we already loaded versions
-            if task_id in self.expanded_versions:
+            # Check if we already loaded (or are loading) versions
+            if task_id in self.expanded_versions or task_id in self._pending_versions:
                 return
 
             # Find the placeholder item
@@ -385,29 +581,56 @@ class DependenciesDialog(QDialog):
         placeholder_item: QTreeWidgetItem
     ):
         """
-        Load all versions for a task.
+        Start loading all versions for a task in the background.
+        The placeholder shows a loading message until _on_versions_loaded replaces it.
 
         Args:
             task_item: Task tree item
             task_id: Task ID
             placeholder_item: Placeholder item to replace
         """
-        try:
-            # Query all versions (excluding rejected/omitted)
-            versions = self.version_manager.get_entities(
-                filters=[
-                    ['sg_task', 'is', {'type': 'Task', 'id': task_id}],
-                    ['sg_status_list', 'not_in', EXCLUDED_VERSION_STATUSES]
-                ],
-                fields=[
-                    'id', 'code', 'created_at', 'published_files',
-                    'sg_status_list', 'sg_task'
-                ],
-                order=[{'field_name': 'created_at', 'direction': 'desc'}]
-            )
+        placeholder_item.setText(0, "Loading versions...")
+        self._pending_versions[task_id] = (task_item, placeholder_item)
+
+        # Reuse versions loaded earlier in the session
+        cached = self.version_manager.versions_cache.get(task_id)
+        if cached is not None:
+            self._on_versions_loaded(task_id, cached)
+            return
+
+        # Query all versions (excluding rejected/omitted)
+        worker = VersionFetchWorker(
+            task_id=task_id,
+            version_manager=self.version_manager,
+            filters=[
+                ['sg_task', 'is', {'type': 'Task', 'id': task_id}],
+                ['sg_status_list', 'not_in', EXCLUDED_VERSION_STATUSES]
+            ],
+            fields=VERSION_TREE_FIELDS,
+            order=[{'field_name': 'created_at', 'direction': 'desc'}]
+        )
+        worker.signals.finished.connect(self._on_versions_loaded)
+        worker.signals.failed.connect(self._on_versions_failed)
+        self._thread_pool.start(worker)
+
+    @Slot(int, list)
+    def _on_versions_loaded(self, task_id: int, versions: list):
+        """
+        Replace a task's loading placeholder with its versions.
+
+        Args:
+            task_id: Task ID
+            versions: Version dictionaries, newest first
+        """
+        pending = self._pending_versions.pop(task_id, None)
+        if pending is None:
+            return
+        task_item, placeholder_item = pending
 
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
             # Remove placeholder
-            index = task_item.indexOfChild(placeholder_item)
             task_item.removeChild(placeholder_item)
 
             # Add all versions (skip first one if it's already shown as latest)
@@ -418,9 +641,11 @@ class DependenciesDialog(QDialog):
             start_index = 1 if skip_first else 0
 
             if start_index < len(versions):
-                # Add remaining versions at the position where placeholder was
-                for i, version in enumerate(versions[start_index:]):
-                    self._add_version_item(task_item, version, is_latest=False)
+                # Add remaining versions with a single insert
+                task_item.addChildren([
+                    self._create_version_item(version, is_latest=False)
+                    for version in versions[start_index:]
+                ])
             else:
                 # No additional versions
                 no_more_item = QTreeWidgetItem(
@@ -429,19 +654,45 @@ class DependenciesDialog(QDialog):
                 )
                 no_more_item.setForeground(0, Qt.gray)
 
-            # Mark as expanded
+            # Mark as expanded, failed queries never reach the cache
             self.expanded_versions[task_id] = versions
+            self.version_manager.versions_cache[task_id] = versions
 
             self.logger.info(f"Loaded {len(versions)} versions for task {task_id}")
 
         except Exception as e:
             self.logger.error(f"Error loading versions for task {task_id}: {e}", exc_info=True)
-            # Show error in tree
-            error_item = QTreeWidgetItem(
-                task_item,
-                [f"Error loading versions: {str(e)}", "", ""]
-            )
-            error_item.setForeground(0, Qt.red)
+            self._show_versions_error(task_item, str(e))
+
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+
+    @Slot(int, str)
+    def _on_versions_failed(self, task_id: int, message: str):
+        """
+        Show a failed version query in the tree.
+
+        Args:
+            task_id: Task ID
+            message: Error message
+        """
+        pending = self._pending_versions.pop(task_id, None)
+        if pending is None:
+            return
+        task_item, placeholder_item = pending
+
+        self.logger.error(f"Error loading versions for task {task_id}: {message}")
+        task_item.removeChild(placeholder_item)
+        self._show_versions_error(task_item, message)
+
+    def _show_versions_error(self, task_item: QTreeWidgetItem, message: str):
+        """Show error in tree."""
+        error_item = QTreeWidgetItem(
+            task_item,
+            [f"Error loading versions: {message}", "", ""]
+        )
+        error_item.setForeground(0, Qt.red)
 
     # ========================================================================
     # Context Menu
@@ -606,70 +857,13 @@ class DependenciesDialog(QDialog):
 
         version_code = version.get('code', 'Unknown')
 
-        # Create progress dialog
-        progress = QProgressDialog(
-            f"Downloading version {version_code}...",
-            "Cancel",
-            0,
-            100,
-            self
+        self._start_download(
+            [{'version': version, 'task': task_data}],
+            title="Downloading Files",
+            label=f"Downloading version {version_code}...",
+            progress_format="Downloading {name}... ({current}/{total})",
+            version_code=version_code
         )
-        progress.setWindowTitle("Downloading Files")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.setValue(0)
-
-        QApplication.processEvents()
-
-        try:
-            downloaded_files = []
-
-            # Progress callback
-            def update_progress(current, total, filename):
-                if progress.wasCanceled():
-                    raise Exception("Download canceled by user")
-
-                progress.setMaximum(total)
-                progress.setValue(current)
-                progress.setLabelText(f"Downloading {filename}... ({current}/{total})")
-                QApplication.processEvents()
-
-            # Download version
-            downloaded_files = self.download_service.download_version(
-                version=version,
-                task_data=task_data,
-                progress_callback=update_progress
-            )
-
-            progress.close()
-
-            # Show success message
-            if downloaded_files:
-                QMessageBox.information(
-                    self,
-                    "Download Complete",
-                    f"Successfully downloaded {len(downloaded_files)} file(s) from {version_code}:\n\n" +
-                    "\n".join(f"  • {os.path.basename(f)}" for f in downloaded_files[:5]) +
-                    (f"\n  ... and {len(downloaded_files) - 5} more" if len(downloaded_files) > 5 else "")
-                )
-
-                # Emit signal
-                self.files_downloaded.emit(downloaded_files)
-            else:
-                QMessageBox.warning(
-                    self,
-                    "No Files Downloaded",
-                    "No files were downloaded. Check logs for details."
-                )
-
-        except Exception as e:
-            progress.close()
-            self.logger.error(f"Download failed: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Download Failed",
-                f"Failed to download files:\n{str(e)}"
-            )
 
     def _download_multiple_versions(
         self,
@@ -683,83 +877,136 @@ class DependenciesDialog(QDialog):
             versions_data: List of {'version': dict, 'task': dict}
             title: Progress dialog title
         """
-        # Create progress dialog
-        progress = QProgressDialog(
-            "Preparing download...",
-            "Cancel",
-            0,
-            100,
-            self
+        self._start_download(
+            versions_data,
+            title=title,
+            label=f"Downloading {len(versions_data)} version(s)...",
+            progress_format="Downloaded version {current}/{total}: {name}",
+            version_code=None
         )
+
+    def _start_download(
+        self,
+        versions_data: List[Dict],
+        title: str,
+        label: str,
+        progress_format: str,
+        version_code: Optional[str]
+    ):
+        """
+        Run a DownloadWorker and drive the progress dialog from its signals.
+
+        Args:
+            versions_data: List of {'version': dict, 'task': dict}
+            title: Progress dialog title
+            label: Initial progress label
+            progress_format: Progress label, formatted with current, total and name
+            version_code: Version code of a single version download (progress per file),
+                          None for several versions (progress per version)
+        """
+        if self._download is not None:
+            QMessageBox.information(self, "Download Running", "Please wait for the current download to finish.")
+            return
+
+        # Create progress dialog
+        progress = QProgressDialog(label, "Cancel", 0, 100, self)
         progress.setWindowTitle(title)
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
-        QApplication.processEvents()
-
-        try:
-            all_downloaded_files = []
-            total_versions = len(versions_data)
-
-            for i, version_info in enumerate(versions_data):
-                version = version_info['version']
-                task = version_info['task']
-                version_code = version.get('code', 'Unknown')
-
-                if progress.wasCanceled():
-                    raise Exception("Download canceled by user")
-
-                progress.setLabelText(
-                    f"Downloading version {i + 1}/{total_versions}: {version_code}..."
-                )
-                progress.setValue(int((i / total_versions) * 100))
-                QApplication.processEvents()
-
-                # Download this version
-                try:
-                    downloaded = self.download_service.download_version(
-                        version=version,
-                        task_data=task,
-                        progress_callback=None  # No individual progress for batch
-                    )
-                    all_downloaded_files.extend(downloaded)
+        cancel_event = threading.Event()
+        progress.canceled.connect(self._on_download_canceled)
+
+        self._download = {
+            'progress': progress,
+            'cancel_event': cancel_event,
+            'progress_format': progress_format,
+            'version_code': version_code,
+            'total_versions': len(versions_data)
+        }
+
+        worker = DownloadWorker(
+            self.download_service,
+            versions_data,
+            cancel_event,
+            per_file_progress=version_code is not None
+        )
+        worker.signals.progress.connect(self._on_download_progress)
+        worker.signals.finished.connect(self._on_download_finished)
+        worker.signals.failed.connect(self._on_download_failed)
+        self._thread_pool.start(worker)
+
+    @Slot(int, int, str)
+    def _on_download_progress(self, current: int, total: int, name: str):
+        """Update the progress dialog."""
+        if self._download is None:
+            return
+        progress = self._download['progress']
+        progress.setMaximum(total)
+        progress.setValue(current)
+        progress.setLabelText(self._download['progress_format'].format(current=current, total=total, name=name))
 
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to download version {version_code}: {e}"
-                    )
-                    # Continue with other versions
+    @Slot()
+    def _on_download_canceled(self):
+        """Ask the running DownloadWorker to stop before its next file."""
+        if self._download is not None:
+            self._download['cancel_event'].set()
 
-            progress.close()
+    @Slot(list)
+    def _on_download_finished(self, downloaded_files: list):
+        """
+        Close the progress dialog and report the downloaded files.
 
-            # Show summary
-            if all_downloaded_files:
-                QMessageBox.information(
-                    self,
-                    "Download Complete",
-                    f"Successfully downloaded {len(all_downloaded_files)} file(s) "
-                    f"from {total_versions} version(s)."
+        Args:
+            downloaded_files: Downloaded file paths
+        """
+        download, self._download = self._download, None
+        download['progress'].close()
+
+        # Show success message
+        if downloaded_files:
+            version_code = download['version_code']
+            if version_code is not None:
+                message = (
+                    f"Successfully downloaded {len(downloaded_files)} file(s) from {version_code}:\n\n" +
+                    "\n".join(f"  • {os.path.basename(f)}" for f in downloaded_files[:5]) +
+                    (f"\n  ... and {len(downloaded_files) - 5} more" if len(downloaded_files) > 5 else "")
                 )
-
-                # Emit signal
-                self.files_downloaded.emit(all_downloaded_files)
             else:
-                QMessageBox.warning(
-                    self,
-                    "No Files Downloaded",
-                    "No files were downloaded. Check logs for details."
+                message = (
+                    f"Successfully downloaded {len(downloaded_files)} file(s) "
+                    f"from {download['total_versions']} version(s)."
                 )
+            QMessageBox.information(self, "Download Complete", message)
 
-        except Exception as e:
-            progress.close()
-            self.logger.error(f"Batch download failed: {e}", exc_info=True)
-            QMessageBox.critical(
+            # Emit signal
+            self.files_downloaded.emit(downloaded_files)
+        else:
+            QMessageBox.warning(
                 self,
-                "Download Failed",
-                f"Download was interrupted:\n{str(e)}"
+                "No Files Downloaded",
+                "No files were downloaded. Check logs for details."
             )
 
+    @Slot(str)
+    def _on_download_failed(self, message: str):
+        """
+        Close the progress dialog and report a failed or canceled download.
+
+        Args:
+            message: Error message
+        """
+        download, self._download = self._download, None
+        download['progress'].close()
+
+        self.logger.error(f"Download failed: {message}")
+        QMessageBox.critical(
+            self,
+            "Download Failed",
+            f"Failed to download files:\n{message}"
+        )
+
     # ========================================================================
     # Styling
     # ========================================================================
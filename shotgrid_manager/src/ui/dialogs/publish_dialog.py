@@ -23,7 +23,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QAction, QIcon
 
 from core.publishing_service import PublishingService, PublishingError
-from core.version_manger import VersionManager
+from core.version_manager import VersionManager
 from utils.zip_utility import ZipUtility
 
 
@@ -18,7 +18,7 @@ from core.shotgrid_instance import ShotgridInstance
 from core.task_manager import TaskManager
 from core.asset_manager import AssetManager
 from core.shot_manager import ShotManager
-from core.version_manger import VersionManager
+from core.version_manager import VersionManager
 from core.published_file_manager import PublishedFileManager
 from core.publishing_service import PublishingService
 from core.dependency_resolver import DependencyResolver
@@ -1,12 +1,21 @@
 import logging
 import sys
 
+# Set once logging is configured, later setup_logging() calls return immediately
+_LOGGING_READY = False
+
 
 def setup_logging():
     """
         Configures the root logger for the entire application.
         this function should be called once at the application starting point. 
+        Safe to call repeatedly (managers call it on init), only the first call does any work.
     """
+    global _LOGGING_READY
+    if _LOGGING_READY:
+        return
+    _LOGGING_READY = True
+
     if not logging.getLogger().hasHandlers():
 
         logging.basicConfig(
@@ -7,6 +7,7 @@ Can be used with UI progress bars, logging, or any custom callback.
 
 from typing import Optional, Callable
 import logging
+import threading
 
 
 class ProgressTracker:
@@ -15,6 +16,7 @@ class ProgressTracker:
 
     Tracks current progress and reports to an optional callback function.
     Useful for driving progress bars, status updates, or logging.
+    step() and update() are thread safe, so worker threads can report progress.
 
     Example:
         >>> def update_ui(current, total, message):
@@ -45,6 +47,7 @@ class ProgressTracker:
         self.current_step = 0
         self.callback = callback
         self.logger = logger
+        self._lock = threading.Lock()
 
     def step(self, message: str = ""):
         """
@@ -53,15 +56,16 @@ class ProgressTracker:
         Args:
             message: Description of current step
         """
-        self.current_step += 1
+        with self._lock:
+            self.current_step += 1
 
-        # Call callback if provided
-        if self.callback:
-            self.callback(self.current_step, self.total_steps, message)
+            # Call callback if provided
+            if self.callback:
+                self.callback(self.current_step, self.total_steps, message)
 
-        # Log if logger provided
-        if self.logger:
-            self.logger.info(f"[{self.current_step}/{self.total_steps}] {message}")
+            # Log if logger provided
+            if self.logger:
+                self.logger.info(f"[{self.current_step}/{self.total_steps}] {message}")
 
     def update(self, current_step: int, message: str = ""):
         """
@@ -71,13 +75,14 @@ class ProgressTracker:
             current_step: Step number to set
             message: Description of current step
         """
-        self.current_step = current_step
+        with self._lock:
+            self.current_step = current_step
 
-        if self.callback:
-            self.callback(self.current_step, self.total_steps, message)
+            if self.callback:
+                self.callback(self.current_step, self.total_steps, message)
 
-        if self.logger:
-            self.logger.info(f"[{self.current_step}/{self.total_steps}] {message}")
+            if self.logger:
+                self.logger.info(f"[{self.current_step}/{self.total_steps}] {message}")
 
     def reset(self):
         """Reset progress to zero."""
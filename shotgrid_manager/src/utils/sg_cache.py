@@ -0,0 +1,133 @@
+"""
+Shared ShotGrid row cache
+
+Process-wide cache for rows that several components resolve by id
+(e.g. PathBuilder and the publishing/download services all key off task_id).
+Living at module level lets separate manager instances reuse the same rows.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache with per-entry time-to-live.
+
+    Example:
+        >>> cache = TTLCache(maxsize=2, ttl=60)
+        >>> cache[1] = {'id': 1}
+        >>> cache.get(1)
+        {'id': 1}
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Max number of entries, least recently used is evicted first
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value, or default if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove entry and return its value (expired or not)."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[1]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Task rows keyed by task id
+TASK_CACHE = TTLCache(maxsize=8192, ttl=300)
+
+# Task list queries (hashed entity/filters/fields -> rows) used by TaskManager,
+# project-wide lists change less often
+TASK_QUERY_TTL = 30
+PROJECT_QUERY_TTL = 60
+TASK_QUERIES = TTLCache(maxsize=1024, ttl=TASK_QUERY_TTL)
+PROJECT_QUERIES = TTLCache(maxsize=64, ttl=PROJECT_QUERY_TTL)
+
+
+def evict_task(task_id: Optional[int] = None):
+    """
+    Drop cached Task reads after a Task write, whichever manager made it.
+
+    Args:
+        task_id: Written task, its row is dropped; None for creates/deletes that only change lists
+    """
+    if task_id is not None:
+        TASK_CACHE.pop(task_id, None)
+    TASK_QUERIES.clear()
+    PROJECT_QUERIES.clear()
+
+
+def get_task(shotgun_instance, task_id: int, fields: List[str]) -> Optional[dict]:
+    """
+    Get a Task row through the shared cache.
+
+    A cached row is reused when it already has every requested field,
+    otherwise the task is fetched and the new fields are merged into the cached row.
+
+    Args:
+        shotgun_instance: ShotgridInstance with active connection
+        task_id: Shotgun task ID
+        fields: Fields the caller needs
+
+    Returns:
+        Task dictionary, or None if not found
+    """
+    cached = TASK_CACHE.get(task_id)
+    if cached is not None and all(field in cached for field in fields):
+        return cached
+
+    shotgun_instance.ensure_connected()
+    task = shotgun_instance.instance.find_one(
+        entity_type="Task",
+        filters=[["id", "is", task_id]],
+        fields=fields
+    )
+
+    if not task:
+        return None
+
+    if cached is not None:
+        task = {**cached, **task}
+
+    TASK_CACHE[task_id] = task
+    return task
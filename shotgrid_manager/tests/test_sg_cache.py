@@ -0,0 +1,152 @@
+"""
+Tests for utils.sg_cache: TTLCache expiry/eviction and get_task field merging.
+"""
+
+import pytest
+
+from utils import sg_cache
+
+
+class FakeClock:
+    """Stands in for the time module inside sg_cache, advanced manually."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FakeClient:
+    """Shotgun client stub recording find_one calls."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def find_one(self, entity_type, filters, fields):
+        self.calls.append(list(fields))
+        row = self.rows.get(filters[0][2])
+        if row is None:
+            return None
+        return {"type": entity_type, "id": row["id"], **{field: row[field] for field in fields if field in row}}
+
+
+class FakeShotgridInstance:
+    """ShotgridInstance stub, only what get_task uses."""
+
+    def __init__(self, rows):
+        self.instance = FakeClient(rows)
+
+    def ensure_connected(self):
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(sg_cache, "time", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def empty_task_cache():
+    sg_cache.TASK_CACHE.clear()
+    yield
+    sg_cache.TASK_CACHE.clear()
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    cache = sg_cache.TTLCache(maxsize=4, ttl=10)
+    cache["a"] = 1
+
+    clock.now += 10
+    assert cache.get("a") == 1
+
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_setitem_refreshes_ttl(clock):
+    cache = sg_cache.TTLCache(maxsize=4, ttl=10)
+    cache["a"] = 1
+    clock.now += 8
+    cache["a"] = 2
+    clock.now += 8
+    assert cache.get("a") == 2
+
+
+def test_evicts_least_recently_used_at_maxsize(clock):
+    cache = sg_cache.TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_returns_value_even_when_expired(clock):
+    cache = sg_cache.TTLCache(maxsize=2, ttl=5)
+    cache["a"] = 1
+    clock.now += 6
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert cache.pop("a", "missing") == "missing"
+
+
+def test_clear_removes_all_entries(clock):
+    cache = sg_cache.TTLCache(maxsize=4, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_get_task_reuses_cached_row_with_all_fields(clock):
+    shotgun = FakeShotgridInstance({5: {"id": 5, "content": "anim", "sg_status_list": "ip"}})
+
+    first = sg_cache.get_task(shotgun, 5, ["content", "sg_status_list"])
+    second = sg_cache.get_task(shotgun, 5, ["content"])
+
+    assert second is first
+    assert shotgun.instance.calls == [["content", "sg_status_list"]]
+
+
+def test_get_task_merges_new_fields_into_cached_row(clock):
+    shotgun = FakeShotgridInstance({5: {"id": 5, "content": "anim", "sg_status_list": "ip"}})
+
+    sg_cache.get_task(shotgun, 5, ["content"])
+    task = sg_cache.get_task(shotgun, 5, ["sg_status_list"])
+
+    assert task["content"] == "anim"
+    assert task["sg_status_list"] == "ip"
+    assert shotgun.instance.calls == [["content"], ["sg_status_list"]]
+    assert sg_cache.TASK_CACHE.get(5) == task
+
+
+def test_get_task_refetches_after_ttl(clock):
+    shotgun = FakeShotgridInstance({5: {"id": 5, "content": "anim"}})
+
+    sg_cache.get_task(shotgun, 5, ["content"])
+    clock.now += sg_cache.TASK_CACHE.ttl + 1
+    sg_cache.get_task(shotgun, 5, ["content"])
+
+    assert len(shotgun.instance.calls) == 2
+
+
+def test_get_task_missing_task_is_not_cached(clock):
+    shotgun = FakeShotgridInstance({})
+
+    assert sg_cache.get_task(shotgun, 7, ["content"]) is None
+    assert sg_cache.TASK_CACHE.get(7) is None
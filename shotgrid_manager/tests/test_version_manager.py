@@ -0,0 +1,68 @@
+"""
+Tests for VersionManager's version numbering: numeric client_code maximum and count fallback.
+"""
+
+import pytest
+
+# core.version_manager pulls in ShotgridInstance, which needs requests
+pytest.importorskip("requests")
+
+from core.version_manager import VersionManager
+
+
+class StubVersionManager(VersionManager):
+    """VersionManager without a connection, serving client_code rows from a list."""
+
+    def __init__(self, client_codes, count=0, fail_read=False):
+        self.client_codes = client_codes
+        self.count = count
+        self.fail_read = fail_read
+        self.count_calls = 0
+
+    def iter_entities(self, filters, fields, order=None, page_size=None):
+        if self.fail_read:
+            raise RuntimeError("find failed")
+        return iter([{"type": "Version", "id": index, "client_code": code} for index, code in enumerate(self.client_codes)])
+
+    def count_versions_for_task(self, task_id):
+        self.count_calls += 1
+        return self.count
+
+
+def test_latest_version_is_numeric_maximum_past_v999():
+    manager = StubVersionManager(["v998", "v1000", "v999"])
+
+    assert manager.get_latest_version_number_for_task(5) == 1000
+    assert manager.get_next_version_number_for_task(5) == 1001
+
+
+def test_latest_version_ignores_codes_that_are_not_vnnn():
+    manager = StubVersionManager(["v002", "final", None, "", "v003_wip", "V007"])
+
+    assert manager.get_latest_version_number_for_task(5) == 7
+
+
+def test_latest_version_is_none_without_vnnn_codes():
+    manager = StubVersionManager(["final", None])
+
+    assert manager.get_latest_version_number_for_task(5) is None
+
+
+def test_next_version_falls_back_to_count_without_vnnn_codes():
+    manager = StubVersionManager(["final", "approved"], count=2)
+
+    assert manager.get_next_version_number_for_task(5) == 3
+    assert manager.count_calls == 1
+
+
+def test_next_version_is_one_for_task_without_versions():
+    manager = StubVersionManager([], count=0)
+
+    assert manager.get_next_version_number_for_task(5) == 1
+
+
+def test_next_version_falls_back_to_count_when_read_fails():
+    manager = StubVersionManager([], count=4, fail_read=True)
+
+    assert manager.get_next_version_number_for_task(5) == 5
+    assert manager.count_calls == 1